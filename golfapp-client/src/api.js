@@ -0,0 +1,44 @@
+import API_URL from './config';
+
+// GET requests may be served by a read replica that lags behind writes. Every write
+// returns a Read-Primary-Until deadline; sending it back on later requests makes the
+// API read from the primary until then, so users see their own changes straight away.
+// It is a header rather than a cookie because the API is on another site, and Safari
+// blocks cross-site cookies.
+const PRIMARY_STICKY_HEADER = 'Read-Primary-Until';
+const STORAGE_KEY = 'readPrimaryUntil';
+
+function readPrimaryUntil() {
+    try {
+        return sessionStorage.getItem(STORAGE_KEY);
+    } catch (e) {
+        return null;
+    }
+}
+
+function rememberReadPrimaryUntil(deadline) {
+    try {
+        sessionStorage.setItem(STORAGE_KEY, deadline);
+    } catch (e) {
+        // Storage unavailable (private mode); reads just go to the replica sooner
+    }
+}
+
+// Drop-in replacement for fetch(`${API_URL}${path}`, options)
+export async function apiFetch(path, options = {}) {
+    const headers = new Headers(options.headers);
+    const deadline = readPrimaryUntil();
+    // The server compares the deadline with its own clock, so send it even if it looks expired here
+    if (deadline && !headers.has(PRIMARY_STICKY_HEADER)) {
+        headers.set(PRIMARY_STICKY_HEADER, deadline);
+    }
+
+    const response = await fetch(`${API_URL}${path}`, { ...options, headers });
+    const newDeadline = response.headers.get(PRIMARY_STICKY_HEADER);
+    if (newDeadline) {
+        rememberReadPrimaryUntil(newDeadline);
+    }
+    return response;
+}
+
+export default apiFetch;
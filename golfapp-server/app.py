@@ -1,17 +1,262 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, abort, g, has_request_context, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
 from flask_cors import CORS
 from flask_migrate import Migrate
 import os
+import re
 import json
+import time
+import zlib
+import heapq
+import bisect
+import random
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from itertools import groupby, islice
 from datetime import date
-from sqlalchemy.orm import joinedload
-
-db = SQLAlchemy()
+from sqlalchemy.exc import IntegrityError
+
+try:
+    import orjson
+except ImportError:  # Fall back to Flask's stdlib json encoder
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # Only gzip is offered
+    brotli = None
+
+# Writes return a deadline in this header; clients that send it back read from the
+# primary until then. A cookie would be cross-site (and blocked by Safari) here.
+PRIMARY_STICKY_HEADER = 'Read-Primary-Until'
+
+class RoutingSession(Session):
+    # Sends reads to the 'replica' bind when the current request allows it.
+    # Flushes and Core inserts/updates/deletes always go to the primary, and pin
+    # the rest of the request there so it reads back its own writes.
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_request_context() and g.get('use_replica'):
+            if self._flushing or getattr(clause, 'is_dml', False):
+                g.use_replica = False
+            else:
+                return self._db.engines['replica']
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+class OrjsonProvider(DefaultJSONProvider):
+    # Encodes responses with orjson. Debug (indented) output and calls passing
+    # json.dumps keyword arguments still go through the stdlib encoder.
+    options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.options).decode()
+
+    def response(self, *args, **kwargs):
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.options | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+# Content-Encodings offered to clients, best first
+COMPRESSION_ENCODINGS = ['br', 'gzip'] if brotli else ['gzip']
+
+def compress_stream(chunks, encoding):
+    # Compresses an iterable of str/bytes chunks as they are produced
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=5)
+        process, finish = compressor.process, compressor.finish
+    else:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31 writes a gzip container
+        process, finish = compressor.compress, compressor.flush
+    try:
+        for chunk in chunks:
+            data = process(chunk.encode() if isinstance(chunk, str) else chunk)
+            if data:
+                yield data
+        yield finish()
+    finally:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+
+class SearchIndex:
+    # In-process prefix/trigram index for autocomplete, kept current by the write endpoints.
+    # Prefix matches come from sorted lists of fields and words; fuzzy matches use trigrams
+    # taken per word like pg_trgm ("  jo", " jo", "joh", ...).
+    SIMILARITY_THRESHOLD = 0.25
+
+    def __init__(self):
+        self.records = {}      # id -> (result dict, lowercased fields, trigrams, trigrams per word)
+        self.trigrams = {}     # trigram -> ids
+        self.field_keys = []   # sorted (field, id)
+        self.word_keys = []    # sorted (word, field, id) for every word after a field's first
+        self.loaded = False
+        self.generation = None  # Search generation of the table the index reflects
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def make_trigrams(text):
+        trigrams = set()
+        for word in text.split():
+            padded = f'  {word} '
+            trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+        return trigrams
+
+    @staticmethod
+    def similarity(trigrams, other_trigrams):
+        shared = len(trigrams & other_trigrams)
+        return shared / (len(trigrams) + len(other_trigrams) - shared)
+
+    @staticmethod
+    def sort_keys(record_id, fields):
+        field_keys = [(field, record_id) for field in fields]
+        word_keys = [(word, field, record_id) for field in fields for word in field.split()[1:]]
+        return field_keys, word_keys
+
+    def is_current(self, generation):
+        return self.loaded and self.generation == generation
+
+    def load(self, entries, generation):
+        # entries: (id, result dict, searchable strings)
+        with self.lock:
+            self.records, self.trigrams = {}, {}
+            self.field_keys, self.word_keys = [], []
+            for record_id, record, fields in entries:
+                self._add(record_id, record, fields, sort=False)
+            self.field_keys.sort()
+            self.word_keys.sort()
+            self.loaded = True
+            self.generation = generation
+
+    def apply(self, generation_change, added=(), removed=()):
+        # Applies one committed write, given as the (previous, new) generation of its table.
+        # If the index missed another worker's write in between, it is left behind and the
+        # next search reloads it instead.
+        with self.lock:
+            if generation_change is None or not self.loaded or self.generation != generation_change[0]:
+                return
+            for record_id in removed:
+                self._remove(record_id)
+            for record_id, record, fields in added:
+                self._add(record_id, record, fields)
+            self.generation = generation_change[1]
+
+    def _add(self, record_id, record, fields, sort=True):
+        self._remove(record_id)
+        fields = tuple(field.lower() for field in fields if field)
+        word_trigrams = [self.make_trigrams(word) for field in fields for word in field.split()]
+        trigrams = set().union(*word_trigrams)
+        self.records[record_id] = (record, fields, trigrams, word_trigrams)
+        for trigram in trigrams:
+            self.trigrams.setdefault(trigram, set()).add(record_id)
+
+        field_keys, word_keys = self.sort_keys(record_id, fields)
+        if sort:
+            for key in field_keys:
+                bisect.insort(self.field_keys, key)
+            for key in word_keys:
+                bisect.insort(self.word_keys, key)
+        else:
+            self.field_keys.extend(field_keys)
+            self.word_keys.extend(word_keys)
+
+    def _remove(self, record_id):
+        entry = self.records.pop(record_id, None)
+        if entry:
+            for trigram in entry[2]:
+                ids = self.trigrams[trigram]
+                ids.discard(record_id)
+                if not ids:
+                    del self.trigrams[trigram]
+            field_keys, word_keys = self.sort_keys(record_id, entry[1])
+            for keys, key in [(self.field_keys, key) for key in field_keys] + [(self.word_keys, key) for key in word_keys]:
+                del keys[bisect.bisect_left(keys, key)]
+
+    @staticmethod
+    def prefix_matches(keys, query, seen):
+        # Ids of the keys starting with query, in key order, skipping ids already seen
+        position = bisect.bisect_left(keys, (query,))
+        while position < len(keys) and keys[position][0].startswith(query):
+            record_id = keys[position][-1]
+            if record_id not in seen:
+                seen.add(record_id)
+                yield record_id
+            position += 1
+
+    def search(self, query, limit):
+        # Ranks whole-field prefix matches, then word prefix matches, each alphabetically
+        # (pg_trgm's word_similarity ties on them too), then fuzzy matches by trigram similarity
+        query = query.strip().lower()
+        query_trigrams = self.make_trigrams(query)
+        if not query_trigrams:
+            return []
+
+        with self.lock:
+            seen = set()
+            matches = list(islice(self.prefix_matches(self.field_keys, query, seen), limit))
+            matches.extend(islice(self.prefix_matches(self.word_keys, query, seen), limit - len(matches)))
+            if len(matches) < limit:
+                matches.extend(self._fuzzy_matches(query_trigrams, limit - len(matches), seen))
+            return [self.records[record_id][0] for record_id in matches]
+
+    def _fuzzy_matches(self, query_trigrams, limit, seen):
+        # A word of at least two trigrams can only reach the threshold sharing this many
+        threshold = self.SIMILARITY_THRESHOLD
+        min_shared = threshold * (len(query_trigrams) + 2) / (1 + threshold)
+
+        shared_counts = Counter()
+        for trigram in query_trigrams:
+            shared_counts.update(self.trigrams.get(trigram, ()))
+
+        scored = []
+        for record_id, shared in shared_counts.items():
+            if shared < min_shared or record_id in seen:
+                continue
+            record, fields, trigrams, word_trigrams = self.records[record_id]
+            similarity = shared / (len(query_trigrams) + len(trigrams) - shared)
+            # Compare against single words too, so a typo in one word still matches
+            score = max([similarity] + [self.similarity(query_trigrams, word) for word in word_trigrams])
+            if score >= threshold:
+                scored.append((score, record_id))
+        return [record_id for score, record_id in heapq.nlargest(limit, scored)]
+
+class TTLCache:
+    # Bounded LRU cache whose entries expire at a given time
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, expires_at):
+        with self.lock:
+            self.entries[key] = (expires_at, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 migrate = Migrate()
 
 def create_app():
     app = Flask(__name__)
+    if orjson:
+        app.json = OrjsonProvider(app)
 
     # Use the DATABASE_URL from Render's environment
     db_url = os.environ.get("DATABASE_URL")
@@ -21,6 +266,22 @@ def create_app():
     app.config["SQLALCHEMY_DATABASE_URI"] = db_url or "sqlite:///C:/Users/simon/golf-web-app/golfapp-server/instance/golf.db"
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+    # Optional read replica for GET traffic on busy tournament days
+    replica_url = os.environ.get("DATABASE_REPLICA_URL")
+    if replica_url and replica_url.startswith("postgres://"):
+        replica_url = replica_url.replace("postgres://", "postgresql://", 1)
+    if replica_url:
+        app.config['SQLALCHEMY_BINDS'] = {'replica': replica_url}
+    # Clients that wrote within this many seconds keep reading from the primary
+    app.config['PRIMARY_STICKY_SECONDS'] = int(os.environ.get("PRIMARY_STICKY_SECONDS", 5))
+    # Idempotency-Key responses are replayed for this long
+    app.config['IDEMPOTENCY_TTL_SECONDS'] = int(os.environ.get("IDEMPOTENCY_TTL_SECONDS", 24 * 60 * 60))
+    app.config['IDEMPOTENCY_CACHE_SIZE'] = int(os.environ.get("IDEMPOTENCY_CACHE_SIZE", 1024))
+    # JSON bodies smaller than this are not worth compressing
+    app.config['COMPRESS_MIN_SIZE'] = int(os.environ.get("COMPRESS_MIN_SIZE", 1024))
+    # Rows fetched and encoded at a time by the streamed list endpoints
+    app.config['STREAM_BATCH_SIZE'] = int(os.environ.get("STREAM_BATCH_SIZE", 200))
+
     db.init_app(app)
     migrate.init_app(app, db)
     CORS(app, resources={
@@ -29,10 +290,56 @@ def create_app():
                 "https://golf-app-client-simon.azurewebsites.net",
                 "https://golf-app.greensky-eadbd98c.uksouth.azurecontainerapps.io",
                 "https://react-frontend-t8y9.onrender.com"
-            ]
+            ],
+            "expose_headers": [PRIMARY_STICKY_HEADER],
+            # Reads that send the sticky header are preflighted; let browsers cache that
+            "max_age": 600
         }
     }, supports_credentials=True)
 
+    @app.before_request
+    def route_reads_to_replica():
+        # GET requests read from the replica unless this client wrote recently,
+        # so users always see their own writes even while the replica lags
+        g.use_replica = (
+            'replica' in app.config.get('SQLALCHEMY_BINDS', {})
+            and request.method == 'GET'
+            and request.headers.get(PRIMARY_STICKY_HEADER, 0, type=float) < time.time()
+        )
+
+    @app.after_request
+    def stick_writers_to_primary(response):
+        if ('replica' in app.config.get('SQLALCHEMY_BINDS', {})
+                and request.method not in ('GET', 'HEAD', 'OPTIONS')
+                and response.status_code < 400):
+            response.headers[PRIMARY_STICKY_HEADER] = str(time.time() + app.config['PRIMARY_STICKY_SECONDS'])
+        return response
+
+    @app.after_request
+    def compress_response(response):
+        # Negotiated gzip/brotli for JSON. Streamed responses are compressed chunk by chunk;
+        # stream_json only streams bodies of at least COMPRESS_MIN_SIZE.
+        if (response.status_code < 200 or response.status_code in (204, 304)
+                or response.mimetype != 'application/json'
+                or 'Content-Encoding' in response.headers):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = request.accept_encodings.best_match(COMPRESSION_ENCODINGS)
+        if not encoding:
+            return response
+
+        if response.is_streamed:
+            response.response = compress_stream(response.response, encoding)
+            response.headers.pop('Content-Length', None)
+        else:
+            data = response.get_data()
+            if len(data) < app.config['COMPRESS_MIN_SIZE']:
+                return response
+            response.set_data(b''.join(compress_stream([data], encoding)))
+        response.headers['Content-Encoding'] = encoding
+        return response
+
     @app.route('/')
     def index():
         return "Hello, World!"
@@ -51,7 +358,16 @@ def create_app():
             db.Column('sequence_number', db.Integer, nullable=False, default=0, primary_key=True)
         )
 
+        # gin indexes behind the pg_trgm search path. Postgres only; the migration that
+        # creates them also installs the pg_trgm extension.
+        def trigram_indexes(table_name, *columns):
+            if not app.config['SQLALCHEMY_DATABASE_URI'].startswith('postgresql'):
+                return ()
+            return tuple(db.Index(f'ix_{table_name}_{column}_trgm', column, postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'})
+                         for column in columns)
+
         class Player(db.Model):
+            __table_args__ = trigram_indexes('player', 'name')
             id = db.Column(db.Integer, primary_key=True)
             name = db.Column(db.String(80), unique=True, nullable=False)
             handicap = db.Column(db.Float, nullable=True)
@@ -67,6 +383,7 @@ def create_app():
                 }
 
         class Course(db.Model):
+            __table_args__ = trigram_indexes('course', 'name', 'country')
             id = db.Column(db.Integer, primary_key=True)
             name = db.Column(db.String(120), unique=True, nullable=False)
             country = db.Column(db.String(80), nullable=True)
@@ -128,6 +445,7 @@ def create_app():
             player_handicap_index = db.Column(db.Float, nullable=True)
             player_playing_handicap = db.Column(db.Integer, nullable=True)
             is_finalized = db.Column(db.Boolean, default=False, nullable=False)
+            version = db.Column(db.Integer, default=1, server_default='1', nullable=False) # Bumped on every change, used by /sync
 
             # Summary scores
             gross_score_front_9 = db.Column(db.Integer, nullable=True)
@@ -165,6 +483,8 @@ def create_app():
                     'player_handicap_index': self.player_handicap_index,
                     'player_playing_handicap': self.player_playing_handicap,
                     'is_finalized': self.is_finalized, # New field
+                    'version': self.version,
+                    'thru': len(self.hole_scores), # Holes played so far
                     'hole_scores': [score.to_dict() for score in self.hole_scores]
                 }
 
@@ -199,11 +519,434 @@ def create_app():
                     'adjustment': self.adjustment
                 }
 
+        class MeritPoints(db.Model):
+            position = db.Column(db.Integer, primary_key=True)
+            points = db.Column(db.Float, nullable=False)
+
+            def __repr__(self):
+                return f'<MeritPoints {self.position}: {self.points}>'
+
+            def to_dict(self):
+                return {
+                    'position': self.position,
+                    'points': self.points
+                }
+
+        # Final standings of each completed tournament, kept so rankings can be adjusted
+        # incrementally when a tournament is finalized or re-opened
+        class TournamentResult(db.Model):
+            tournament_id = db.Column(db.Integer, db.ForeignKey('tournament.id'), primary_key=True)
+            player_id = db.Column(db.Integer, db.ForeignKey('player.id'), primary_key=True)
+            season = db.Column(db.String(20), nullable=False)
+            position = db.Column(db.Integer, nullable=False)
+            stableford_total = db.Column(db.Integer, nullable=False)
+            points = db.Column(db.Float, nullable=False)
+
+        # Order of merit totals per season, precomputed from TournamentResult
+        class PlayerRanking(db.Model):
+            season = db.Column(db.String(20), primary_key=True)
+            player_id = db.Column(db.Integer, db.ForeignKey('player.id'), primary_key=True)
+            points = db.Column(db.Float, nullable=False, default=0)
+            events = db.Column(db.Integer, nullable=False, default=0)
+            wins = db.Column(db.Integer, nullable=False, default=0)
+
+            player = db.relationship('Player')
+
+        # Per-table write marker for the in-process search indexes (see SearchIndex)
+        class SearchGeneration(db.Model):
+            name = db.Column(db.String(20), primary_key=True)
+            generation = db.Column(db.Integer, nullable=False, default=0)
+
+        class IdempotencyKey(db.Model):
+            key = db.Column(db.String(255), primary_key=True)
+            fingerprint = db.Column(db.String(64), nullable=False) # sha256 of method, path and body
+            status_code = db.Column(db.Integer, nullable=True) # Null while the first request is still running
+            body = db.Column(db.Text, nullable=True)
+            created_at = db.Column(db.Float, nullable=False, index=True) # Unix timestamp
+
+            def __repr__(self):
+                return '<IdempotencyKey %r>' % self.key
+
+        # Idempotency-Key support for POST endpoints. The first request claims the key by
+        # inserting a row, later requests with the same key get the stored response replayed.
+        # Rows are shared by all gunicorn workers, the cache saves the lookup in each worker.
+        idempotency_cache = TTLCache(app.config['IDEMPOTENCY_CACHE_SIZE'])
+        # A claim with no response after this long belongs to a request that died mid-way
+        IDEMPOTENCY_ABANDONED_SECONDS = 300
+
+        @app.before_request
+        def replay_idempotent_request():
+            key = request.headers.get('Idempotency-Key')
+            if request.method != 'POST' or not key:
+                return None
+            if len(key) > 255:
+                return jsonify({'error': 'Idempotency-Key must be at most 255 characters.'}), 400
+
+            now = time.time()
+            ttl = app.config['IDEMPOTENCY_TTL_SECONDS']
+            fingerprint = hashlib.sha256(b'%s %s\n%s' % (request.method.encode(), request.path.encode(), request.get_data())).hexdigest()
+
+            stored = idempotency_cache.get(key)
+            if stored is None:
+                record = db.session.get(IdempotencyKey, key)
+                if record is None or record.created_at < now - ttl:
+                    IdempotencyKey.query.filter(IdempotencyKey.created_at < now - ttl).delete()
+                    db.session.add(IdempotencyKey(key=key, fingerprint=fingerprint, created_at=now))
+                    try:
+                        db.session.commit()
+                    except IntegrityError:
+                        db.session.rollback()
+                        return jsonify({'error': 'A request with this Idempotency-Key is still in progress.'}), 409
+                    g.idempotency_key = key
+                    return None
+                if record.status_code is None:
+                    if record.fingerprint != fingerprint:
+                        return jsonify({'error': 'Idempotency-Key was already used for a different request.'}), 422
+                    if record.created_at > now - IDEMPOTENCY_ABANDONED_SECONDS:
+                        return jsonify({'error': 'A request with this Idempotency-Key is still in progress.'}), 409
+                    # Conditional update so only one of several concurrent retries takes over the claim
+                    claimed = IdempotencyKey.query.filter_by(key=key, status_code=None, created_at=record.created_at).update({'created_at': now})
+                    db.session.commit()
+                    if not claimed:
+                        return jsonify({'error': 'A request with this Idempotency-Key is still in progress.'}), 409
+                    g.idempotency_key = key
+                    return None
+                stored = (record.fingerprint, record.status_code, record.body)
+                idempotency_cache.set(key, stored, record.created_at + ttl)
+
+            stored_fingerprint, status_code, body = stored
+            if stored_fingerprint != fingerprint:
+                return jsonify({'error': 'Idempotency-Key was already used for a different request.'}), 422
+            response = app.response_class(body, status=status_code, mimetype='application/json')
+            response.headers['Idempotent-Replayed'] = 'true'
+            return response
+
+        @app.after_request
+        def store_idempotent_response(response):
+            key = g.pop('idempotency_key', None)
+            if not key:
+                return response
+
+            # Anything the view left uncommitted would have been discarded anyway
+            db.session.rollback()
+            record = db.session.get(IdempotencyKey, key)
+            if record is not None:
+                if response.status_code >= 500:
+                    # Let the client retry with the same key
+                    db.session.delete(record)
+                else:
+                    record.status_code = response.status_code
+                    record.body = response.get_data(as_text=True)
+                    idempotency_cache.set(key, (record.fingerprint, record.status_code, record.body),
+                                          record.created_at + app.config['IDEMPOTENCY_TTL_SECONDS'])
+                db.session.commit()
+            return response
+
+        # Read-only fast path: the list endpoints below select plain column tuples with
+        # SQLAlchemy Core and map them straight to dicts, skipping ORM object hydration.
+        # The dicts match the models' to_dict output.
+        round_table = Round.__table__
+        hole_score_table = HoleScore.__table__
+        player_table = Player.__table__
+        course_table = Course.__table__
+        tournament_table = Tournament.__table__
+
+        round_keys = tuple(column.name for column in round_table.c)
+        hole_score_keys = tuple(column.name for column in hole_score_table.c)
+        player_keys = tuple(column.name for column in player_table.c)
+        course_keys = tuple(column.name for column in course_table.c)
+        tournament_keys = tuple(column.name for column in tournament_table.c)
+
+        def course_row_to_dict(row):
+            course_dict = dict(zip(course_keys, row))
+            course_dict['hole_pars'] = json.loads(course_dict['hole_pars']) if course_dict['hole_pars'] else []
+            course_dict['hole_stroke_indices'] = json.loads(course_dict['hole_stroke_indices']) if course_dict['hole_stroke_indices'] else []
+            return course_dict
+
+        def iter_keyset_batches(query, key_column, load_related=lambda rows: None):
+            # Yields (rows, related) for query in batches of STREAM_BATCH_SIZE rows by keyset on
+            # key_column, where related is whatever load_related fetches for the batch. The
+            # connection is released after each batch, so a slow download never holds a
+            # pooled connection or transaction.
+            query = query.order_by(key_column).limit(app.config['STREAM_BATCH_SIZE'])
+            last_key = None
+            while True:
+                rows = db.session.execute(query if last_key is None else query.where(key_column > last_key)).all()
+                if not rows:
+                    return
+                related = load_related(rows)
+
+                # Give the connection back to the pool before the batch goes out to the client
+                db.session.rollback()
+
+                yield rows, related
+
+                if len(rows) < app.config['STREAM_BATCH_SIZE']:
+                    return
+                last_key = rows[-1]._mapping[key_column]
+
+        def iter_round_rows(*criteria, with_names=False):
+            # Yields (round_row, hole_score_rows) in round id order
+            columns = list(round_table.c)
+            if with_names:
+                columns += [player_table.c.name, course_table.c.name]
+            query = db.select(*columns).select_from(round_table).where(*criteria)
+            if with_names:
+                query = (query.outerjoin(player_table, player_table.c.id == round_table.c.player_id)
+                              .outerjoin(course_table, course_table.c.id == round_table.c.course_id))
+
+            def load_hole_scores(rows):
+                hole_scores_by_round = {}
+                hole_query = (db.select(*hole_score_table.c)
+                                .where(hole_score_table.c.round_id.in_([row.id for row in rows]))
+                                .order_by(hole_score_table.c.round_id, hole_score_table.c.hole_number))
+                for hole_row in db.session.execute(hole_query):
+                    hole_scores_by_round.setdefault(hole_row.round_id, []).append(hole_row)
+                return hole_scores_by_round
+
+            for rows, hole_scores_by_round in iter_keyset_batches(query, round_table.c.id, load_hole_scores):
+                for row in rows:
+                    yield row, hole_scores_by_round.get(row.id, [])
+
+        def iter_rounds(*criteria, with_names=False):
+            round_key_count = len(round_keys)
+            for row, hole_score_rows in iter_round_rows(*criteria, with_names=with_names):
+                round_dict = dict(zip(round_keys, row))
+                round_dict['thru'] = len(hole_score_rows)
+                round_dict['hole_scores'] = [dict(zip(hole_score_keys, hole_row)) for hole_row in hole_score_rows]
+                if with_names:
+                    player_name, course_name = row[round_key_count:]
+                    round_dict['player_name'] = player_name if player_name is not None else 'Unknown Player'
+                    round_dict['course_name'] = course_name if course_name is not None else 'Unknown Course'
+                yield round_dict
+
+        def columnar_round_columns(with_names=False):
+            columns = list(round_keys) + ['thru', 'hole_gross', 'hole_nett', 'hole_stableford']
+            if with_names:
+                columns += ['player_name', 'course_name']
+            return columns
+
+        def iter_columnar_rounds(*criteria, with_names=False):
+            # Compact rows: hole scores become three 18-long integer arrays indexed by
+            # hole number - 1, with null for holes not played yet
+            round_key_count = len(round_keys)
+            for row, hole_score_rows in iter_round_rows(*criteria, with_names=with_names):
+                hole_gross, hole_nett, hole_stableford = [None] * 18, [None] * 18, [None] * 18
+                for hole_row in hole_score_rows:
+                    hole_index = hole_row.hole_number - 1
+                    hole_gross[hole_index] = hole_row.gross_score
+                    hole_nett[hole_index] = hole_row.nett_score
+                    hole_stableford[hole_index] = hole_row.stableford_points
+                values = list(row[:round_key_count]) + [len(hole_score_rows), hole_gross, hole_nett, hole_stableford]
+                if with_names:
+                    player_name, course_name = row[round_key_count:]
+                    values += [player_name if player_name is not None else 'Unknown Player',
+                               course_name if course_name is not None else 'Unknown Course']
+                yield values
+
+        def select_tournaments(*criteria):
+            # Three queries regardless of the number of tournaments
+            players_by_tournament = {}
+            player_query = (db.select(tournament_players.c.tournament_id, *player_table.c)
+                              .join(player_table, player_table.c.id == tournament_players.c.player_id)
+                              .join(tournament_table, tournament_table.c.id == tournament_players.c.tournament_id)
+                              .where(*criteria))
+            for row in db.session.execute(player_query):
+                players_by_tournament.setdefault(row[0], []).append(dict(zip(player_keys, row[1:])))
+
+            courses_by_tournament = {}
+            course_query = (db.select(tournament_courses.c.tournament_id, tournament_courses.c.sequence_number, *course_table.c)
+                              .join(course_table, course_table.c.id == tournament_courses.c.course_id)
+                              .join(tournament_table, tournament_table.c.id == tournament_courses.c.tournament_id)
+                              .where(*criteria))
+            for row in db.session.execute(course_query):
+                course_dict = course_row_to_dict(row[2:])
+                course_dict['sequence_number'] = row[1]
+                courses_by_tournament.setdefault(row[0], []).append(course_dict)
+
+            tournaments_data = []
+            for row in db.session.execute(db.select(*tournament_table.c).where(*criteria).order_by(tournament_table.c.id)):
+                tournament_dict = dict(zip(tournament_keys, row))
+                tournament_dict['players'] = players_by_tournament.get(tournament_dict['id'], [])
+                tournament_dict['courses'] = courses_by_tournament.get(tournament_dict['id'], [])
+                tournaments_data.append(tournament_dict)
+            return tournaments_data
+
+        def columnar_tournaments():
+            # Players and courses are sent once in their own sections and referenced by id.
+            # Returns (columns, rows, sections) for stream_json; every part is a lazy iterator.
+            def iter_members(table, association, row_to_dict):
+                query = db.select(*table.c).where(table.c.id.in_(db.select(association.c[f'{table.name}_id'])))
+                for rows, _ in iter_keyset_batches(query, table.c.id):
+                    for row in rows:
+                        yield list(row_to_dict(row).values())
+
+            def load_memberships(rows):
+                tournament_ids = [row.id for row in rows]
+                player_ids, courses = {}, {}
+                for tournament_id, player_id in db.session.execute(
+                        db.select(tournament_players.c.tournament_id, tournament_players.c.player_id)
+                          .where(tournament_players.c.tournament_id.in_(tournament_ids))
+                          .order_by(tournament_players.c.player_id)):
+                    player_ids.setdefault(tournament_id, []).append(player_id)
+                for tournament_id, course_id, sequence_number in db.session.execute(
+                        db.select(tournament_courses.c.tournament_id, tournament_courses.c.course_id, tournament_courses.c.sequence_number)
+                          .where(tournament_courses.c.tournament_id.in_(tournament_ids))
+                          .order_by(tournament_courses.c.sequence_number, tournament_courses.c.course_id)):
+                    courses.setdefault(tournament_id, []).append([course_id, sequence_number])
+                return player_ids, courses
+
+            def iter_rows():
+                for rows, (player_ids, courses) in iter_keyset_batches(db.select(*tournament_table.c), tournament_table.c.id, load_memberships):
+                    for row in rows:
+                        yield list(row) + [player_ids.get(row.id, []), courses.get(row.id, [])]
+
+            sections = {
+                'players': (list(player_keys), iter_members(player_table, tournament_players, lambda row: dict(zip(player_keys, row)))),
+                'courses': (list(course_keys), iter_members(course_table, tournament_courses, course_row_to_dict))
+            }
+            return list(tournament_keys) + ['player_ids', 'courses'], iter_rows(), sections
+
+        def stream_json(rows, columns=None, sections=None):
+            # Encodes rows in batches as they are produced so memory stays flat for large responses.
+            # With columns, emits the compact {"columns": [...], "rows": [[...], ...]} form, after
+            # any sections given as {name: (columns, rows)}, each streamed in the same form.
+            def encode_rows(rows):
+                batch, separator = [], ''
+                for row in rows:
+                    batch.append(row)
+                    if len(batch) >= app.config['STREAM_BATCH_SIZE']:
+                        yield separator + app.json.dumps(batch)[1:-1]
+                        batch, separator = [], ','
+                if batch:
+                    yield separator + app.json.dumps(batch)[1:-1]
+
+            def generate():
+                if columns is None:
+                    yield '['
+                    yield from encode_rows(rows)
+                    yield ']'
+                    return
+
+                yield '{'
+                for name, (section_columns, section_rows) in (sections or {}).items():
+                    yield f'{app.json.dumps(name)}:{{"columns":{app.json.dumps(section_columns)},"rows":['
+                    yield from encode_rows(section_rows)
+                    yield ']},'
+                yield f'"columns":{app.json.dumps(columns)},"rows":['
+                yield from encode_rows(rows)
+                yield ']}'
+
+            # Encode ahead up to COMPRESS_MIN_SIZE here in the view: a body that ends before
+            # that is sent whole (and uncompressed), as the headers can't wait on the stream
+            chunks, head, size = generate(), [], 0
+            for chunk in chunks:
+                head.append(chunk)
+                size += len(chunk)
+                if size >= app.config['COMPRESS_MIN_SIZE']:
+                    break
+            else:
+                return app.response_class(''.join(head), mimetype='application/json')
+
+            def resume():
+                yield from head
+                yield from chunks
+
+            return app.response_class(stream_with_context(resume()), mimetype='application/json')
+
+        def wants_columnar():
+            # Opt-in compact encoding for mobile clients
+            return request.args.get('format') == 'columnar'
+
+        # Autocomplete indexes. Each gunicorn worker holds its own copy, so on Postgres
+        # the search endpoints use pg_trgm instead when the extension is installed.
+        # Elsewhere every player/course write replaces the table's search generation, and a
+        # worker reloads its index only when it sees a generation it did not apply itself.
+        player_search_index = SearchIndex()
+        course_search_index = SearchIndex()
+        search_backend = {}
+        search_generation_table = SearchGeneration.__table__
+
+        def player_entry(player):
+            return player.id, {'id': player.id, 'name': player.name}, [player.name]
+
+        def course_entry(course):
+            return course.id, {'id': course.id, 'name': course.name, 'country': course.country}, [course.name, course.country]
+
+        def bump_search_generation(name):
+            # Call in the writing transaction, before commit. Returns the (previous, new)
+            # generation for SearchIndex.apply. Generations are random rather than counted,
+            # so a recreated table never repeats one an index has already seen.
+            if use_pg_trgm():
+                return None
+            generation = search_generation_table.c.generation
+            is_name = search_generation_table.c.name == name
+            # No-op update first, so the row (or on SQLite the database) is locked before the
+            # read and concurrent writers see each other's generations
+            if not db.session.execute(search_generation_table.update().where(is_name).values(generation=generation)).rowcount:
+                db.session.execute(search_generation_table.insert().values(name=name, generation=0))
+            previous = db.session.execute(db.select(generation).where(is_name)).scalar()
+            new = random.randrange(1, 2 ** 31)
+            db.session.execute(search_generation_table.update().where(is_name).values(generation=new))
+            return previous, new
+
+        def use_pg_trgm():
+            if 'pg_trgm' not in search_backend:
+                search_backend['pg_trgm'] = (
+                    db.session.get_bind().dialect.name == 'postgresql'
+                    and db.session.execute(db.text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).first() is not None
+                )
+            return search_backend['pg_trgm']
+
+        def search_with_pg_trgm(table, fields, query, limit):
+            # Same ranking as SearchIndex.search, using pg_trgm's word_similarity
+            pattern = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            similarity = db.func.greatest(*(db.func.coalesce(db.func.word_similarity(query, field), 0) for field in fields))
+            prefix = db.or_(*(field.ilike(f'{pattern}%') for field in fields))
+            word_prefix = db.or_(*(field.ilike(f'% {pattern}%') for field in fields))
+            # ILIKE and the %> operator (rather than word_similarity() >= ...) can use the
+            # gin trigram indexes; %> compares against pg_trgm.word_similarity_threshold
+            fuzzy = db.or_(*(field.op('%>')(query) for field in fields))
+            db.session.execute(db.select(db.func.set_config('pg_trgm.word_similarity_threshold', str(SearchIndex.SIMILARITY_THRESHOLD), True)))
+            statement = (db.select(table.c.id, *fields)
+                           .where(db.or_(prefix, word_prefix, fuzzy))
+                           .order_by(prefix.desc(), word_prefix.desc(), similarity.desc(), table.c.name)
+                           .limit(limit))
+            return db.session.execute(statement).all()
+
+        def refresh_search_index(index, name, columns, entry):
+            # The generation and rows come from the primary: loading from a lagging replica
+            # would keep serving its stale rows until the next write
+            g.use_replica = False
+            generation = db.session.execute(
+                db.select(search_generation_table.c.generation).where(search_generation_table.c.name == name)
+            ).scalar() or 0
+            if not index.is_current(generation):
+                index.load((entry(row) for row in db.session.execute(db.select(*columns))), generation)
+
+        def search_request_args():
+            query = request.args.get('q', '').strip()
+            limit = max(1, min(request.args.get('limit', 10, type=int), 50))
+            return query, limit
+
         @app.route('/players', methods=['GET'])
         def get_players():
             players = Player.query.all()
             return jsonify([player.to_dict() for player in players])
 
+        @app.route('/players/search', methods=['GET'])
+        def search_players():
+            query, limit = search_request_args()
+            if not query:
+                return jsonify([])
+
+            if use_pg_trgm():
+                rows = search_with_pg_trgm(player_table, [player_table.c.name], query, limit)
+                return jsonify([{'id': row.id, 'name': row.name} for row in rows])
+
+            refresh_search_index(player_search_index, 'player', [player_table.c.id, player_table.c.name], player_entry)
+            return jsonify(player_search_index.search(query, limit))
+
         @app.route('/players/<int:player_id>', methods=['GET'])
         def get_player(player_id):
             player = Player.query.get_or_404(player_id)
@@ -217,7 +960,9 @@ def create_app():
             
             new_player = Player(name=data['name'], handicap=data.get('handicap'))
             db.session.add(new_player)
+            generation_change = bump_search_generation('player')
             db.session.commit()
+            player_search_index.apply(generation_change, added=[player_entry(new_player)])
             return jsonify(new_player.to_dict()), 201
 
         @app.route('/players/<int:player_id>', methods=['PUT'])
@@ -230,21 +975,150 @@ def create_app():
             if 'handicap' in data:
                 player.handicap = data['handicap']
             
+            generation_change = bump_search_generation('player')
             db.session.commit()
+            player_search_index.apply(generation_change, added=[player_entry(player)])
             return jsonify(player.to_dict())
 
         @app.route('/players/<int:player_id>', methods=['DELETE'])
         def delete_player(player_id):
             player = Player.query.get_or_404(player_id)
             db.session.delete(player)
+            generation_change = bump_search_generation('player')
             db.session.commit()
+            player_search_index.apply(generation_change, removed=[player_id])
             return '', 204
 
+        PLAYER_BULK_FIELDS = {'id': (int, 'an integer'), 'name': (str, 'a string'), 'handicap': ((int, float), 'a number')}
+
+        @app.route('/players/bulk', methods=['POST'])
+        def add_players_bulk():
+            players_data = bulk_list(request.get_json(), 'players')
+            if players_data is None:
+                return jsonify({'error': 'players must be a list'}), 400
+            errors = [bulk_item_error(item, PLAYER_BULK_FIELDS) for item in players_data]
+
+            names = [item.get('name') for item, error in zip(players_data, errors) if not error and item.get('name')]
+            taken_names = set(db.session.execute(db.select(player_table.c.name).where(player_table.c.name.in_(names))).scalars()) if names else set()
+
+            results, created = [], []
+            for index, (item, error) in enumerate(zip(players_data, errors)):
+                if error:
+                    results.append({'index': index, 'status': 'invalid', 'error': error})
+                    continue
+                name = item.get('name')
+                if not name:
+                    results.append({'index': index, 'status': 'invalid', 'error': 'Name is required'})
+                elif name in taken_names:
+                    results.append({'index': index, 'status': 'duplicate', 'error': f'Player {name} already exists'})
+                else:
+                    taken_names.add(name)
+                    new_player = Player(name=name, handicap=item.get('handicap'))
+                    db.session.add(new_player)
+                    result = {'index': index, 'status': 'created'}
+                    results.append(result)
+                    created.append((result, new_player))
+
+            generation_change = bump_search_generation('player') if created else None
+            db.session.commit()
+            player_search_index.apply(generation_change, added=[player_entry(new_player) for _, new_player in created])
+            for result, new_player in created:
+                result['player'] = new_player.to_dict()
+            return jsonify({'results': results}), 200
+
+        @app.route('/players/bulk', methods=['PATCH'])
+        def update_players_bulk():
+            players_data = bulk_list(request.get_json(), 'players')
+            if players_data is None:
+                return jsonify({'error': 'players must be a list'}), 400
+            errors = [bulk_item_error(item, PLAYER_BULK_FIELDS) for item in players_data]
+            valid_items = [item for item, error in zip(players_data, errors) if not error]
+
+            player_ids = [item['id'] for item in valid_items if item.get('id') is not None]
+            players_by_id = {player.id: player for player in Player.query.filter(Player.id.in_(player_ids)).all()} if player_ids else {}
+            names = [item['name'] for item in valid_items if item.get('name')]
+            name_owners = dict(db.session.execute(db.select(player_table.c.name, player_table.c.id).where(player_table.c.name.in_(names))).all()) if names else {}
+
+            results, updated = [], []
+            for index, (item, error) in enumerate(zip(players_data, errors)):
+                if error:
+                    results.append({'index': index, 'status': 'invalid', 'error': error})
+                    continue
+                player = players_by_id.get(item.get('id'))
+                if item.get('id') is None:
+                    results.append({'index': index, 'status': 'invalid', 'error': 'Player id is required'})
+                elif not player:
+                    results.append({'index': index, 'id': item['id'], 'status': 'not_found'})
+                elif 'name' in item and not item['name']:
+                    results.append({'index': index, 'id': player.id, 'status': 'invalid', 'error': 'Name is required'})
+                elif item.get('name') and name_owners.get(item['name'], player.id) != player.id:
+                    results.append({'index': index, 'id': player.id, 'status': 'duplicate', 'error': f"Player {item['name']} already exists"})
+                else:
+                    if 'name' in item:
+                        name_owners.pop(player.name, None)
+                        player.name = item['name']
+                        name_owners[player.name] = player.id
+                    if 'handicap' in item:
+                        player.handicap = item['handicap']
+                    result = {'index': index, 'id': player.id, 'status': 'updated'}
+                    results.append(result)
+                    updated.append((result, player))
+
+            generation_change = bump_search_generation('player') if updated else None
+            db.session.commit()
+            player_search_index.apply(generation_change, added=[player_entry(player) for _, player in updated])
+            for result, player in updated:
+                result['player'] = player.to_dict()
+            return jsonify({'results': results}), 200
+
+        @app.route('/players/bulk', methods=['DELETE'])
+        def delete_players_bulk():
+            player_ids = bulk_list(request.get_json(), 'player_ids')
+            if player_ids is None:
+                return jsonify({'error': 'player_ids must be a list'}), 400
+
+            existing_ids = find_existing_ids(player_table.c.id, filter(is_id, player_ids))
+            # Players with recorded rounds are kept, their rounds reference them
+            in_use_ids = find_existing_ids(round_table.c.player_id, existing_ids)
+            deletable_ids = existing_ids - in_use_ids
+
+            if deletable_ids:
+                db.session.execute(tournament_players.delete().where(tournament_players.c.player_id.in_(deletable_ids)))
+                db.session.execute(player_table.delete().where(player_table.c.id.in_(deletable_ids)))
+            generation_change = bump_search_generation('player') if deletable_ids else None
+            db.session.commit()
+            player_search_index.apply(generation_change, removed=deletable_ids)
+
+            results = []
+            for player_id in player_ids:
+                if not is_id(player_id):
+                    results.append({'id': player_id, 'status': 'invalid', 'error': 'Player id must be an integer'})
+                elif player_id in deletable_ids:
+                    results.append({'id': player_id, 'status': 'deleted'})
+                elif player_id in in_use_ids:
+                    results.append({'id': player_id, 'status': 'in_use', 'error': 'Player has recorded rounds'})
+                else:
+                    results.append({'id': player_id, 'status': 'not_found'})
+            return jsonify({'results': results}), 200
+
         @app.route('/courses', methods=['GET'])
         def get_courses():
             courses = Course.query.all()
             return jsonify([course.to_dict() for course in courses])
 
+        @app.route('/courses/search', methods=['GET'])
+        def search_courses():
+            query, limit = search_request_args()
+            if not query:
+                return jsonify([])
+
+            if use_pg_trgm():
+                rows = search_with_pg_trgm(course_table, [course_table.c.name, course_table.c.country], query, limit)
+                return jsonify([{'id': row.id, 'name': row.name, 'country': row.country} for row in rows])
+
+            refresh_search_index(course_search_index, 'course', [course_table.c.id, course_table.c.name, course_table.c.country], course_entry)
+            return jsonify(course_search_index.search(query, limit))
+
         @app.route('/courses/<int:course_id>', methods=['GET'])
         def get_course(course_id):
             course = Course.query.get_or_404(course_id)
@@ -264,7 +1138,9 @@ def create_app():
                 hole_stroke_indices=json.dumps(data.get('hole_stroke_indices', []))
             )
             db.session.add(new_course)
+            generation_change = bump_search_generation('course')
             db.session.commit()
+            course_search_index.apply(generation_change, added=[course_entry(new_course)])
             return jsonify(new_course.to_dict()), 201
 
         @app.route('/courses/<int:course_id>', methods=['PUT'])
@@ -283,25 +1159,160 @@ def create_app():
             if 'hole_stroke_indices' in data:
                 course.hole_stroke_indices = json.dumps(data['hole_stroke_indices'])
             
+            generation_change = bump_search_generation('course')
             db.session.commit()
+            course_search_index.apply(generation_change, added=[course_entry(course)])
             return jsonify(course.to_dict())
 
         @app.route('/courses/<int:course_id>', methods=['DELETE'])
         def delete_course(course_id):
             course = Course.query.get_or_404(course_id)
             db.session.delete(course)
+            generation_change = bump_search_generation('course')
             db.session.commit()
+            course_search_index.apply(generation_change, removed=[course_id])
             return '', 204
 
+        COURSE_BULK_FIELDS = {
+            'id': (int, 'an integer'), 'name': (str, 'a string'), 'country': (str, 'a string'),
+            'slope_rating': ((int, float), 'a number'), 'hole_pars': (list, 'a list'), 'hole_stroke_indices': (list, 'a list')
+        }
+
+        @app.route('/courses/bulk', methods=['POST'])
+        def add_courses_bulk():
+            courses_data = bulk_list(request.get_json(), 'courses')
+            if courses_data is None:
+                return jsonify({'error': 'courses must be a list'}), 400
+            errors = [bulk_item_error(item, COURSE_BULK_FIELDS) for item in courses_data]
+
+            names = [item.get('name') for item, error in zip(courses_data, errors) if not error and item.get('name')]
+            taken_names = set(db.session.execute(db.select(course_table.c.name).where(course_table.c.name.in_(names))).scalars()) if names else set()
+
+            results, created = [], []
+            for index, (item, error) in enumerate(zip(courses_data, errors)):
+                if error:
+                    results.append({'index': index, 'status': 'invalid', 'error': error})
+                    continue
+                name = item.get('name')
+                if not name:
+                    results.append({'index': index, 'status': 'invalid', 'error': 'Course name is required'})
+                elif name in taken_names:
+                    results.append({'index': index, 'status': 'duplicate', 'error': f'Course {name} already exists'})
+                else:
+                    taken_names.add(name)
+                    new_course = Course(
+                        name=name,
+                        country=item.get('country'),
+                        slope_rating=item.get('slope_rating'),
+                        hole_pars=json.dumps(item.get('hole_pars', [])),
+                        hole_stroke_indices=json.dumps(item.get('hole_stroke_indices', []))
+                    )
+                    db.session.add(new_course)
+                    result = {'index': index, 'status': 'created'}
+                    results.append(result)
+                    created.append((result, new_course))
+
+            generation_change = bump_search_generation('course') if created else None
+            db.session.commit()
+            course_search_index.apply(generation_change, added=[course_entry(new_course) for _, new_course in created])
+            for result, new_course in created:
+                result['course'] = new_course.to_dict()
+            return jsonify({'results': results}), 200
+
+        @app.route('/courses/bulk', methods=['PATCH'])
+        def update_courses_bulk():
+            courses_data = bulk_list(request.get_json(), 'courses')
+            if courses_data is None:
+                return jsonify({'error': 'courses must be a list'}), 400
+            errors = [bulk_item_error(item, COURSE_BULK_FIELDS) for item in courses_data]
+            valid_items = [item for item, error in zip(courses_data, errors) if not error]
+
+            course_ids = [item['id'] for item in valid_items if item.get('id') is not None]
+            courses_by_id = {course.id: course for course in Course.query.filter(Course.id.in_(course_ids)).all()} if course_ids else {}
+            names = [item['name'] for item in valid_items if item.get('name')]
+            name_owners = dict(db.session.execute(db.select(course_table.c.name, course_table.c.id).where(course_table.c.name.in_(names))).all()) if names else {}
+
+            results, updated = [], []
+            for index, (item, error) in enumerate(zip(courses_data, errors)):
+                if error:
+                    results.append({'index': index, 'status': 'invalid', 'error': error})
+                    continue
+                course = courses_by_id.get(item.get('id'))
+                if item.get('id') is None:
+                    results.append({'index': index, 'status': 'invalid', 'error': 'Course id is required'})
+                elif not course:
+                    results.append({'index': index, 'id': item['id'], 'status': 'not_found'})
+                elif 'name' in item and not item['name']:
+                    results.append({'index': index, 'id': course.id, 'status': 'invalid', 'error': 'Course name is required'})
+                elif item.get('name') and name_owners.get(item['name'], course.id) != course.id:
+                    results.append({'index': index, 'id': course.id, 'status': 'duplicate', 'error': f"Course {item['name']} already exists"})
+                else:
+                    if 'name' in item:
+                        name_owners.pop(course.name, None)
+                        course.name = item['name']
+                        name_owners[course.name] = course.id
+                    if 'country' in item:
+                        course.country = item['country']
+                    if 'slope_rating' in item:
+                        course.slope_rating = item['slope_rating']
+                    if 'hole_pars' in item:
+                        course.hole_pars = json.dumps(item['hole_pars'])
+                    if 'hole_stroke_indices' in item:
+                        course.hole_stroke_indices = json.dumps(item['hole_stroke_indices'])
+                    result = {'index': index, 'id': course.id, 'status': 'updated'}
+                    results.append(result)
+                    updated.append((result, course))
+
+            generation_change = bump_search_generation('course') if updated else None
+            db.session.commit()
+            course_search_index.apply(generation_change, added=[course_entry(course) for _, course in updated])
+            for result, course in updated:
+                result['course'] = course.to_dict()
+            return jsonify({'results': results}), 200
+
+        @app.route('/courses/bulk', methods=['DELETE'])
+        def delete_courses_bulk():
+            course_ids = bulk_list(request.get_json(), 'course_ids')
+            if course_ids is None:
+                return jsonify({'error': 'course_ids must be a list'}), 400
+
+            existing_ids = find_existing_ids(course_table.c.id, filter(is_id, course_ids))
+            # Courses with recorded rounds are kept, their rounds reference them
+            in_use_ids = find_existing_ids(round_table.c.course_id, existing_ids)
+            deletable_ids = existing_ids - in_use_ids
+
+            if deletable_ids:
+                db.session.execute(tournament_courses.delete().where(tournament_courses.c.course_id.in_(deletable_ids)))
+                db.session.execute(course_table.delete().where(course_table.c.id.in_(deletable_ids)))
+            generation_change = bump_search_generation('course') if deletable_ids else None
+            db.session.commit()
+            course_search_index.apply(generation_change, removed=deletable_ids)
+
+            results = []
+            for course_id in course_ids:
+                if not is_id(course_id):
+                    results.append({'id': course_id, 'status': 'invalid', 'error': 'Course id must be an integer'})
+                elif course_id in deletable_ids:
+                    results.append({'id': course_id, 'status': 'deleted'})
+                elif course_id in in_use_ids:
+                    results.append({'id': course_id, 'status': 'in_use', 'error': 'Course has recorded rounds'})
+                else:
+                    results.append({'id': course_id, 'status': 'not_found'})
+            return jsonify({'results': results}), 200
+
         @app.route('/tournaments', methods=['GET'])
         def get_tournaments():
-            tournaments = Tournament.query.all()
-            return jsonify([tournament.to_dict() for tournament in tournaments])
+            if wants_columnar():
+                columns, rows, sections = columnar_tournaments()
+                return stream_json(rows, columns=columns, sections=sections)
+            return jsonify(select_tournaments())
 
         @app.route('/tournaments/<int:tournament_id>', methods=['GET'])
         def get_tournament(tournament_id):
-            tournament = Tournament.query.get_or_404(tournament_id)
-            return jsonify(tournament.to_dict())
+            tournaments = select_tournaments(tournament_table.c.id == tournament_id)
+            if not tournaments:
+                abort(404)
+            return jsonify(tournaments[0])
 
         @app.route('/tournaments', methods=['POST'])
         def add_tournament():
@@ -320,13 +1331,17 @@ def create_app():
 
         @app.route('/tournaments/<int:tournament_id>', methods=['PUT'])
         def update_tournament(tournament_id):
-            tournament = Tournament.query.get_or_404(tournament_id)
+            # Locked because a date change retracts and re-records the tournament's results
+            tournament = lock_tournament_or_404(tournament_id)
             data = request.get_json()
             
             if 'name' in data:
                 tournament.name = data['name']
             if 'date' in data:
                 tournament.date = data['date']
+                # The date decides the season the results count towards
+                if retract_tournament_results(tournament_id):
+                    record_tournament_results(tournament_id)
             if 'location' in data:
                 tournament.location = data['location']
             
@@ -335,7 +1350,8 @@ def create_app():
 
         @app.route('/tournaments/<int:tournament_id>', methods=['DELETE'])
         def delete_tournament(tournament_id):
-            tournament = Tournament.query.get_or_404(tournament_id)
+            tournament = lock_tournament_or_404(tournament_id)
+            retract_tournament_results(tournament_id)
             db.session.delete(tournament)
             db.session.commit()
             return '', 204
@@ -347,29 +1363,35 @@ def create_app():
 
         @app.route('/tournaments/<int:tournament_id>/players', methods=['POST'])
         def add_players_to_tournament(tournament_id):
-            tournament = Tournament.query.get_or_404(tournament_id)
-            data = request.get_json()
-            player_ids = data.get('player_ids', [])
-
-            for player_id in player_ids:
-                player = Player.query.get(player_id)
-                if player and player not in tournament.players:
-                    tournament.players.append(player)
+            Tournament.query.get_or_404(tournament_id)
+            player_ids = bulk_list(request.get_json(), 'player_ids')
+            if player_ids is None:
+                return jsonify({'error': 'player_ids must be a list'}), 400
+            apply_player_membership(tournament_id, add_ids=player_ids)
             db.session.commit()
-            return jsonify(tournament.to_dict()), 200
+            return jsonify(select_tournaments(tournament_table.c.id == tournament_id)[0]), 200
 
         @app.route('/tournaments/<int:tournament_id>/players', methods=['DELETE'])
         def remove_players_from_tournament(tournament_id):
-            tournament = Tournament.query.get_or_404(tournament_id)
-            data = request.get_json()
-            player_ids = data.get('player_ids', [])
+            Tournament.query.get_or_404(tournament_id)
+            player_ids = bulk_list(request.get_json(), 'player_ids')
+            if player_ids is None:
+                return jsonify({'error': 'player_ids must be a list'}), 400
+            apply_player_membership(tournament_id, remove_ids=player_ids)
+            db.session.commit()
+            return jsonify(select_tournaments(tournament_table.c.id == tournament_id)[0]), 200
 
-            for player_id in player_ids:
-                player = Player.query.get(player_id)
-                if player and player in tournament.players:
-                    tournament.players.remove(player)
+        @app.route('/tournaments/<int:tournament_id>/players', methods=['PATCH'])
+        def update_tournament_players(tournament_id):
+            # Membership diff in one request: {"add": [player ids], "remove": [player ids]}
+            Tournament.query.get_or_404(tournament_id)
+            data = request.get_json()
+            add_ids, remove_ids = bulk_list(data, 'add'), bulk_list(data, 'remove')
+            if add_ids is None or remove_ids is None:
+                return jsonify({'error': 'add and remove must be lists of player ids'}), 400
+            results = apply_player_membership(tournament_id, add_ids=add_ids, remove_ids=remove_ids)
             db.session.commit()
-            return jsonify(tournament.to_dict()), 200
+            return jsonify({'results': results}), 200
 
         @app.route('/tournaments/<int:tournament_id>/courses', methods=['GET'])
         def get_courses_for_tournament(tournament_id):
@@ -391,49 +1413,35 @@ def create_app():
 
         @app.route('/tournaments/<int:tournament_id>/courses', methods=['POST'])
         def add_courses_to_tournament(tournament_id):
-            tournament = Tournament.query.get_or_404(tournament_id)
-            data = request.get_json()
-            courses_data = data.get('courses', [])
-
-            for course_item in courses_data:
-                course_id = course_item.get('id')
-                sequence_number = course_item.get('sequence_number')
-                course = Course.query.get(course_id)
-                if course:
-                    # Create a new entry in the association table with sequence_number
-                    stmt = tournament_courses.insert().values(
-                        tournament_id=tournament.id,
-                        course_id=course.id,
-                        sequence_number=sequence_number
-                    )
-                    try:
-                        db.session.execute(stmt)
-                    except Exception as e:
-                        db.session.rollback()
-                        print(f"Error adding course {course_id} with sequence {sequence_number}: {e}")
-                        # Optionally, return an error to the frontend here if needed
-                        continue # Skip to the next course_item
+            Tournament.query.get_or_404(tournament_id)
+            courses = bulk_list(request.get_json(), 'courses')
+            if courses is None:
+                return jsonify({'error': 'courses must be a list'}), 400
+            apply_course_membership(tournament_id, add_items=courses)
             db.session.commit()
-            return jsonify(tournament.to_dict()), 200
+            return jsonify(select_tournaments(tournament_table.c.id == tournament_id)[0]), 200
 
         @app.route('/tournaments/<int:tournament_id>/courses', methods=['DELETE'])
         def remove_courses_from_tournament(tournament_id):
-            tournament = Tournament.query.get_or_404(tournament_id)
+            Tournament.query.get_or_404(tournament_id)
+            courses = bulk_list(request.get_json(), 'courses')
+            if courses is None:
+                return jsonify({'error': 'courses must be a list'}), 400
+            apply_course_membership(tournament_id, remove_items=courses)
+            db.session.commit()
+            return jsonify(select_tournaments(tournament_table.c.id == tournament_id)[0]), 200
+
+        @app.route('/tournaments/<int:tournament_id>/courses', methods=['PATCH'])
+        def update_tournament_courses(tournament_id):
+            # Membership diff in one request: {"add": [{id, sequence_number}], "remove": [{id, sequence_number}]}
+            Tournament.query.get_or_404(tournament_id)
             data = request.get_json()
-            courses_to_remove = data.get('courses', [])
-
-            for course_item in courses_to_remove:
-                course_id = course_item.get('id')
-                sequence_number = course_item.get('sequence_number')
-                # Delete directly from the association table
-                stmt = tournament_courses.delete().where(
-                    (tournament_courses.c.tournament_id == tournament.id) &
-                    (tournament_courses.c.course_id == course_id) &
-                    (tournament_courses.c.sequence_number == sequence_number)
-                )
-                db.session.execute(stmt)
+            add_items, remove_items = bulk_list(data, 'add'), bulk_list(data, 'remove')
+            if add_items is None or remove_items is None:
+                return jsonify({'error': 'add and remove must be lists of courses'}), 400
+            results = apply_course_membership(tournament_id, add_items=add_items, remove_items=remove_items)
             db.session.commit()
-            return jsonify(tournament.to_dict()), 200
+            return jsonify({'results': results}), 200
 
         @app.route('/courses/<int:course_id>/holes', methods=['GET'])
         def get_course_holes(course_id):
@@ -476,120 +1484,68 @@ def create_app():
             sequence_number = request.args.get('sequence_number', type=int)
             player_id_str = request.args.get('player_ids')
 
-            from sqlalchemy.orm import joinedload
-            query = Round.query.options(joinedload(Round.hole_scores))
-
+            criteria = []
             if tournament_id:
-                query = query.filter_by(tournament_id=tournament_id)
+                criteria.append(round_table.c.tournament_id == tournament_id)
             if player_id:
-                query = query.filter_by(player_id=player_id)
+                criteria.append(round_table.c.player_id == player_id)
             if course_id:
-                query = query.filter_by(course_id=course_id)
+                criteria.append(round_table.c.course_id == course_id)
             if sequence_number:
-                query = query.filter_by(round_number=sequence_number)
+                criteria.append(round_table.c.round_number == sequence_number)
             if player_id_str:
                 player_ids = [int(pid) for pid in player_id_str.split(',')]
-                query = query.filter(Round.player_id.in_(player_ids))
+                criteria.append(round_table.c.player_id.in_(player_ids))
 
-            rounds = query.all()
-            # Add print statements for debugging
-            for r in rounds:
-                print(f"Round ID: {r.id}, Player Handicap Index: {r.player_handicap_index}, Player Playing Handicap: {r.player_playing_handicap}")
-            return jsonify([r.to_dict() for r in rounds])
+            if wants_columnar():
+                return stream_json(iter_columnar_rounds(*criteria), columns=columnar_round_columns())
+            return stream_json(iter_rounds(*criteria))
 
         @app.route('/rounds/<int:round_id>/scores', methods=['POST'])
         def record_hole_scores(round_id):
-            round_data = Round.query.get_or_404(round_id)
             data = request.get_json()
             hole_scores_data = data.get('hole_scores', [])
 
             if len(hole_scores_data) != 18:
                 return jsonify({'error': 'Exactly 18 hole scores are required.'}), 400
 
+            round_data = lock_round_or_404(round_id)
+            if round_data.is_finalized:
+                return jsonify({'error': 'Round is finalized.'}), 409
+
             player = Player.query.get(round_data.player_id)
             course = Course.query.get(round_data.course_id)
 
             if not player or not course:
                 return jsonify({'error': 'Player or Course not found for this round.'}), 404
 
-            hole_pars = json.loads(course.hole_pars) if course.hole_pars else []
-            hole_stroke_indices = json.loads(course.hole_stroke_indices) if course.hole_stroke_indices else []
-
-            if len(hole_pars) != 18 or len(hole_stroke_indices) != 18:
-                return jsonify({'error': 'Course hole pars or stroke indices are incomplete.'}), 400
-
-            # Initialize summary variables
-            total_gross = 0
-            total_nett = 0
-            total_stableford = 0
-            front_9_gross = 0
-            front_9_nett = 0
-            front_9_stableford = 0
-            back_9_gross = 0
-            back_9_nett = 0
-            back_9_stableford = 0
-
-            for i, score_data in enumerate(hole_scores_data):
-                hole_number = score_data.get('hole_number')
-                gross_score = score_data.get('gross_score')
-
-                if hole_number is None or gross_score is None or not (1 <= hole_number <= 18):
-                    return jsonify({'error': f'Invalid score data for hole {i+1}.'}), 400
+            error = apply_hole_scores(round_data, course, hole_scores_data)
+            if error:
+                return jsonify({'error': error}), 400
 
-                hole_par = hole_pars[hole_number - 1]
-                hole_stroke_index = hole_stroke_indices[hole_number - 1]
+            db.session.commit()
+            return jsonify(round_data.to_dict()), 200
 
-                # Calculate nett score for the hole
-                handicap_strokes_for_this_hole = calculate_hole_handicap_strokes(round_data.player_playing_handicap, hole_stroke_index)
-                nett_score = gross_score - handicap_strokes_for_this_hole
+        @app.route('/rounds/<int:round_id>/scores', methods=['PATCH'])
+        def update_hole_scores(round_id):
+            # Live scoring: accepts any subset of holes and only touches those rows
+            data = request.get_json()
+            hole_scores_data = data.get('hole_scores', [])
 
-                # Calculate Stableford points for the hole
-                stableford_points = calculate_stableford_points(hole_par, round_data.player_playing_handicap, hole_stroke_index, gross_score)
+            if not hole_scores_data:
+                return jsonify({'error': 'At least one hole score is required.'}), 400
 
-                # Check if HoleScore already exists for this round and hole number
-                existing_hole_score = HoleScore.query.filter_by(round_id=round_id, hole_number=hole_number).first()
+            round_data = lock_round_or_404(round_id)
+            if round_data.is_finalized:
+                return jsonify({'error': 'Round is finalized.'}), 409
 
-                if existing_hole_score:
-                    # Update existing score
-                    existing_hole_score.gross_score = gross_score
-                    existing_hole_score.nett_score = nett_score
-                    existing_hole_score.stableford_points = stableford_points
-                    db.session.add(existing_hole_score) # Re-add to session for update
-                else:
-                    # Create new score
-                    new_hole_score = HoleScore(
-                        round_id=round_id,
-                        hole_number=hole_number,
-                        gross_score=gross_score,
-                        nett_score=nett_score,
-                        stableford_points=stableford_points
-                    )
-                    db.session.add(new_hole_score)
-
-                # Accumulate summary scores
-                total_gross += gross_score
-                total_nett += nett_score
-                total_stableford += stableford_points
+            course = Course.query.get(round_data.course_id)
+            if not course:
+                return jsonify({'error': 'Course not found for this round.'}), 404
 
-                if hole_number <= 9:
-                    front_9_gross += gross_score
-                    front_9_nett += nett_score
-                    front_9_stableford += stableford_points
-                else:
-                    back_9_gross += gross_score
-                    back_9_nett += nett_score
-                    back_9_stableford += stableford_points
-
-            # Update round summary scores
-            round_data.gross_score_front_9 = front_9_gross
-            round_data.nett_score_front_9 = round(front_9_nett) # Round to nearest integer
-            round_data.stableford_front_9 = front_9_stableford
-            round_data.gross_score_back_9 = back_9_gross
-            round_data.nett_score_back_9 = round(back_9_nett) # Round to nearest integer
-            round_data.stableford_back_9 = back_9_stableford
-            round_data.gross_score_total = total_gross
-            round_data.nett_score_total = round(total_nett) # Round to nearest integer
-            round_data.stableford_total = total_stableford
+            error = apply_hole_scores(round_data, course, hole_scores_data)
+            if error:
+                return jsonify({'error': error}), 400
 
             db.session.commit()
             return jsonify(round_data.to_dict()), 200
@@ -599,6 +1555,79 @@ def create_app():
             hole_scores = HoleScore.query.filter_by(round_id=round_id).all()
             return jsonify([score.to_dict() for score in hole_scores])
 
+        @app.route('/sync', methods=['POST'])
+        def sync_scores():
+            # Offline clients queue hole scores while out of signal and push them here in one batch.
+            # Each update may carry the round 'version' the client last saw as 'base_version';
+            # updates made against an older version are reported as conflicts and not applied.
+            data = request.get_json() or {}
+            updates = bulk_list(data, 'updates')
+            if updates is None:
+                return jsonify({'error': 'updates must be a list.'}), 400
+            tournament_id = data.get('tournament_id')
+            if tournament_id is not None and not is_id(tournament_id):
+                return jsonify({'error': 'tournament_id must be an integer.'}), 400
+            try:
+                known_versions = {int(round_id): version for round_id, version in data.get('known_versions', {}).items()}
+            except (AttributeError, TypeError, ValueError):
+                return jsonify({'error': 'known_versions must map round ids to versions.'}), 400
+
+            round_ids = {update['round_id'] for update in updates if isinstance(update, dict) and is_id(update.get('round_id'))}
+            rounds_by_id = {r.id: r for r in lock_rounds(round_table.c.id.in_(round_ids))} if round_ids else {}
+            course_ids = {r.course_id for r in rounds_by_id.values()}
+            courses_by_id = {c.id: c for c in Course.query.filter(Course.id.in_(course_ids)).all()} if course_ids else {}
+            # Conflicts are judged against the versions at the start of the sync, so several
+            # queued updates for the same round can share one base_version
+            start_versions = {round_id: r.version for round_id, r in rounds_by_id.items()}
+
+            results = []
+            for update in updates:
+                # A malformed update is rejected on its own so the rest of the queue still syncs
+                if not isinstance(update, dict) or not is_id(update.get('round_id')):
+                    round_id = update.get('round_id') if isinstance(update, dict) else None
+                    results.append({'round_id': round_id, 'status': 'rejected', 'error': 'Update must be an object with an integer round_id.'})
+                    continue
+                round_id = update['round_id']
+                round_data = rounds_by_id.get(round_id)
+                if not round_data:
+                    results.append({'round_id': round_id, 'status': 'not_found'})
+                    continue
+
+                base_version = update.get('base_version')
+                if base_version is not None and base_version != start_versions[round_id]:
+                    results.append({'round_id': round_id, 'status': 'conflict', 'version': round_data.version})
+                    continue
+
+                if round_data.is_finalized:
+                    results.append({'round_id': round_id, 'status': 'finalized', 'version': round_data.version})
+                    continue
+
+                hole_scores_data = update.get('hole_scores')
+                course = courses_by_id.get(round_data.course_id)
+                if not hole_scores_data or not isinstance(hole_scores_data, list):
+                    error = 'At least one hole score is required.'
+                elif not course:
+                    error = 'Course not found for this round.'
+                else:
+                    error = apply_hole_scores(round_data, course, hole_scores_data)
+                if error:
+                    results.append({'round_id': round_id, 'status': 'rejected', 'error': error, 'version': round_data.version})
+                    continue
+
+                results.append({'round_id': round_id, 'status': 'applied', 'version': round_data.version})
+
+            db.session.commit()
+
+            # Send back every round in scope whose version differs from what the client holds
+            query = Round.query
+            if tournament_id:
+                query = query.filter_by(tournament_id=tournament_id)
+            else:
+                query = query.filter(Round.id.in_(set(known_versions) | set(rounds_by_id)))
+            changed_rounds = [r.to_dict() for r in query.all() if known_versions.get(r.id) != r.version]
+
+            return jsonify({'results': results, 'rounds': changed_rounds}), 200
+
         @app.route('/initiate_round', methods=['POST'])
         def initiate_round():
             data = request.get_json()
@@ -652,21 +1681,11 @@ def create_app():
 
         @app.route('/tournaments/<int:tournament_id>/rounds_summary', methods=['GET'])
         def get_rounds_summary_for_tournament(tournament_id):
-            # Fetch all rounds for the given tournament, eagerly loading player and course details
-            rounds = Round.query.filter_by(tournament_id=tournament_id).options(
-                joinedload(Round.player),
-                joinedload(Round.course)
-            ).all()
-
-            rounds_data = []
-            for r in rounds:
-                round_dict = r.to_dict()
-                # Add player and course names directly to the round dictionary for easier consumption
-                round_dict['player_name'] = r.player.name if r.player else 'Unknown Player'
-                round_dict['course_name'] = r.course.name if r.course else 'Unknown Course'
-                rounds_data.append(round_dict)
-            
-            return jsonify(rounds_data)
+            # Rounds with player and course names added for easier consumption
+            criteria = [round_table.c.tournament_id == tournament_id]
+            if wants_columnar():
+                return stream_json(iter_columnar_rounds(*criteria, with_names=True), columns=columnar_round_columns(with_names=True))
+            return stream_json(iter_rounds(*criteria, with_names=True))
 
         @app.route('/tournaments/<int:tournament_id>/rounds/end', methods=['POST'])
         def end_round(tournament_id):
@@ -678,22 +1697,23 @@ def create_app():
 
             # 1. Validation: Check if all players in the tournament have submitted scores for this round
 
-            # Get all rounds for this tournament and the specified round_number
-            rounds_for_current_number = Round.query.filter_by(
-                tournament_id=tournament_id,
-                round_number=round_number_to_end
-            ).all()
+            # Get all rounds for this tournament and the specified round_number, locked until commit
+            # so concurrent finalizations and score writes for them wait for this one
+            rounds_for_current_number = lock_rounds(
+                round_table.c.tournament_id == tournament_id,
+                round_table.c.round_number == round_number_to_end
+            )
 
             if not rounds_for_current_number:
                 return jsonify({'error': f'No rounds found for tournament {tournament_id} and round number {round_number_to_end}.'}), 404
 
-            # Check if all players have submitted scores (stableford_total is not None)
+            # Check if all players have submitted scores for all 18 holes
             for r in rounds_for_current_number:
-                if r.stableford_total is None:
+                if len(r.hole_scores) < 18:
                     return jsonify({'error': f'Scores not submitted for all players in round {round_number_to_end}. Player {r.player_id} is missing scores.'}), 400
 
             # 2. Handicap Calculation & Storage for next round
-            players_in_tournament = Player.query.join(Tournament.players).filter(Tournament.id == tournament_id).all()
+            players_in_tournament = lock_players(Player.query.join(Tournament.players).filter(Tournament.id == tournament_id))
             next_round_number = round_number_to_end + 1
             today = date.today().isoformat()
 
@@ -718,20 +1738,27 @@ def create_app():
             for r in rounds_for_current_number:
                 print(f"Before commit: Round {r.id} (Player {r.player_id}) is_finalized was {r.is_finalized}")
                 r.is_finalized = True
+                r.version += 1
                 db.session.add(r)
 
+            # 4. Finalizing the last round completes the tournament and updates the order of merit
+            if is_tournament_complete(tournament_id):
+                record_tournament_results(tournament_id)
+
             db.session.commit()
             print(f"After commit: Round {r.id} (Player {r.player_id}) is_finalized is now {r.is_finalized}")
             return jsonify({'message': f'Round {round_number_to_end} finalized and handicaps updated successfully!'}), 200
 
         @app.route('/rounds/<int:round_id>/reopen', methods=['POST'])
         def reopen_round(round_id):
-            round_to_reopen = Round.query.get_or_404(round_id)
+            round_to_reopen = lock_round_or_404(round_id)
             if not round_to_reopen.is_finalized:
                 return jsonify({'error': 'Round is not finalized.'}), 400
 
             round_to_reopen.is_finalized = False
+            round_to_reopen.version += 1
             db.session.add(round_to_reopen)
+            retract_tournament_results(round_to_reopen.tournament_id)
             db.session.commit()
             return jsonify({'message': f'Round {round_id} re-opened successfully!'}), 200
 
@@ -743,28 +1770,382 @@ def create_app():
             if sequence_number is None:
                 return jsonify({'error': 'Sequence number is required.'}), 400
 
-            rounds_to_reopen = Round.query.filter_by(
-                tournament_id=tournament_id,
-                round_number=sequence_number,
-                is_finalized=True
-            ).all()
+            rounds_to_reopen = [r for r in lock_rounds(
+                round_table.c.tournament_id == tournament_id,
+                round_table.c.round_number == sequence_number
+            ) if r.is_finalized]
 
             if not rounds_to_reopen:
                 return jsonify({'message': 'No finalized rounds found to re-open for this tournament and sequence.'}), 200
 
+            players_by_id = {player.id: player for player in lock_players(Player.query.filter(Player.id.in_([r.player_id for r in rounds_to_reopen])))}
             for r in rounds_to_reopen:
                 r.is_finalized = False
+                r.version += 1
                 db.session.add(r)
 
                 # Revert player's handicap to what it was at the start of this round
-                player = Player.query.get(r.player_id)
+                player = players_by_id.get(r.player_id)
                 if player and r.player_handicap_index is not None:
                     player.handicap = r.player_handicap_index
                     db.session.add(player)
 
+            retract_tournament_results(tournament_id)
             db.session.commit()
             return jsonify({'message': f'All rounds for tournament {tournament_id}, sequence {sequence_number} re-opened successfully!'}), 200
 
+        def lock_rounds(*criteria):
+            # Loads rounds locked against other writers until commit. Postgres locks only the
+            # selected rows (SELECT ... FOR UPDATE), so other tournaments are unaffected.
+            # SQLite has no row locks; a no-op UPDATE takes its database write lock before
+            # anything is read, which serializes the read-check-write in the same way.
+            query = Round.query.filter(*criteria).order_by(Round.id).populate_existing()
+            if db.session.get_bind().dialect.name == 'sqlite':
+                db.session.execute(round_table.update().where(*criteria).values(version=round_table.c.version))
+                return query.all()
+            return query.with_for_update(of=Round).all()
+
+        def lock_round_or_404(round_id):
+            rounds = lock_rounds(round_table.c.id == round_id)
+            if not rounds:
+                abort(404)
+            return rounds[0]
+
+        def lock_tournament_or_404(tournament_id):
+            # Locks a tournament before its results are read and retracted, so two requests
+            # can't both retract the same results. As in lock_rounds, SQLite takes its database
+            # write lock with a no-op UPDATE, which lock_players then relies on.
+            query = Tournament.query.filter_by(id=tournament_id).populate_existing()
+            if db.session.get_bind().dialect.name == 'sqlite':
+                db.session.execute(tournament_table.update().where(tournament_table.c.id == tournament_id).values(name=tournament_table.c.name))
+                return query.first_or_404()
+            return query.with_for_update(of=Tournament).first_or_404()
+
+        def lock_players(query):
+            # Handicaps are read-modify-write; lock players after their rounds, in id order,
+            # so concurrent finalizations always lock in the same order
+            query = query.order_by(Player.id).populate_existing()
+            if db.session.get_bind().dialect.name == 'sqlite':
+                return query.all()  # Already holding the database write lock
+            return query.with_for_update(of=Player).all()
+
+        def tournament_season(tournament):
+            # Seasons are the calendar year of the tournament date
+            match = re.search(r'\d{4}', tournament.date or '')
+            return match.group() if match else 'undated'
+
+        def is_tournament_complete(tournament_id):
+            # Complete once its last round (the highest course sequence number) is played
+            # and every round is finalized
+            last_round_number = db.session.execute(
+                db.select(db.func.max(tournament_courses.c.sequence_number)).where(tournament_courses.c.tournament_id == tournament_id)
+            ).scalar()
+            highest_round_number, all_finalized = db.session.execute(
+                db.select(db.func.max(round_table.c.round_number), db.func.min(db.case((round_table.c.is_finalized, 1), else_=0)))
+                  .where(round_table.c.tournament_id == tournament_id)
+            ).one()
+            if highest_round_number is None:
+                return False
+            return bool(all_finalized) and highest_round_number >= (last_round_number or highest_round_number)
+
+        def record_tournament_results(tournament_id):
+            # Ranks players on their Stableford total across all rounds. Tied players share
+            # the position and split the points for the places they occupy.
+            retract_tournament_results(tournament_id)
+            season = tournament_season(db.session.get(Tournament, tournament_id))
+            standings = db.session.execute(
+                db.select(round_table.c.player_id, db.func.coalesce(db.func.sum(round_table.c.stableford_total), 0).label('total'))
+                  .where(round_table.c.tournament_id == tournament_id)
+                  .group_by(round_table.c.player_id)
+                  .order_by(db.desc('total'))
+            ).all()
+            if not standings:
+                return
+            points_by_position = dict(db.session.execute(db.select(MeritPoints.position, MeritPoints.points)).all())
+
+            player_ids = [row.player_id for row in standings]
+            lock_players(Player.query.filter(Player.id.in_(player_ids)))
+            rankings = {ranking.player_id: ranking for ranking in PlayerRanking.query.filter(
+                PlayerRanking.season == season, PlayerRanking.player_id.in_(player_ids)
+            ).all()}
+
+            position = 1
+            for total, group in groupby(standings, key=lambda row: row.total):
+                tied_player_ids = [row.player_id for row in group]
+                places = range(position, position + len(tied_player_ids))
+                points = round(sum(points_by_position.get(place, 0) for place in places) / len(tied_player_ids), 2)
+                for player_id in tied_player_ids:
+                    db.session.add(TournamentResult(
+                        tournament_id=tournament_id, player_id=player_id, season=season,
+                        position=position, stableford_total=total, points=points
+                    ))
+                    ranking = rankings.get(player_id)
+                    if ranking is None:
+                        ranking = PlayerRanking(season=season, player_id=player_id, points=0, events=0, wins=0)
+                        db.session.add(ranking)
+                    ranking.points = round(ranking.points + points, 2)
+                    ranking.events += 1
+                    ranking.wins += 1 if position == 1 else 0
+                position += len(tied_player_ids)
+
+        def retract_tournament_results(tournament_id):
+            # Takes a tournament's results back out of the rankings. Returns whether it had any.
+            results = TournamentResult.query.filter_by(tournament_id=tournament_id).all()
+            if not results:
+                return False
+
+            player_ids = [result.player_id for result in results]
+            lock_players(Player.query.filter(Player.id.in_(player_ids)))
+            rankings = {(ranking.season, ranking.player_id): ranking for ranking in PlayerRanking.query.filter(
+                PlayerRanking.player_id.in_(player_ids),
+                PlayerRanking.season.in_({result.season for result in results})
+            ).all()}
+            for result in results:
+                ranking = rankings.get((result.season, result.player_id))
+                if ranking:
+                    ranking.points = round(ranking.points - result.points, 2)
+                    ranking.events -= 1
+                    ranking.wins -= 1 if result.position == 1 else 0
+                    if ranking.events <= 0:
+                        db.session.delete(ranking)
+                db.session.delete(result)
+            db.session.flush()
+            return True
+
+        def recompute_ranking_points():
+            # Re-derives every recorded result's points from its stored position after the
+            # merit points table changes, and applies the differences to the rankings.
+            # The flush takes the write lock first on SQLite, as lock_players expects.
+            db.session.flush()
+            lock_players(Player.query.filter(Player.id.in_(db.select(TournamentResult.player_id))))
+            points_by_position = dict(db.session.execute(db.select(MeritPoints.position, MeritPoints.points)).all())
+            results = TournamentResult.query.all()
+            tied_counts = Counter((result.tournament_id, result.position) for result in results)
+
+            deltas = Counter()
+            for result in results:
+                tied_count = tied_counts[(result.tournament_id, result.position)]
+                places = range(result.position, result.position + tied_count)
+                points = round(sum(points_by_position.get(place, 0) for place in places) / tied_count, 2)
+                if points != result.points:
+                    deltas[(result.season, result.player_id)] += points - result.points
+                    result.points = points
+            if not deltas:
+                return
+
+            rankings = {(ranking.season, ranking.player_id): ranking for ranking in PlayerRanking.query.filter(
+                PlayerRanking.player_id.in_({player_id for _, player_id in deltas}),
+                PlayerRanking.season.in_({season for season, _ in deltas})
+            ).all()}
+            for key, delta in deltas.items():
+                ranking = rankings.get(key)
+                if ranking:
+                    ranking.points = round(ranking.points + delta, 2)
+
+        def apply_hole_scores(round_data, course, hole_scores_data):
+            # Upserts any subset of a round's hole scores and adjusts its summary scores by the difference.
+            # Returns an error message without writing anything if the data is invalid.
+            hole_pars = json.loads(course.hole_pars) if course.hole_pars else []
+            hole_stroke_indices = json.loads(course.hole_stroke_indices) if course.hole_stroke_indices else []
+
+            if len(hole_pars) != 18 or len(hole_stroke_indices) != 18:
+                return 'Course hole pars or stroke indices are incomplete.'
+
+            for i, score_data in enumerate(hole_scores_data):
+                if not isinstance(score_data, dict):
+                    return f'Invalid score data for hole {i+1}.'
+                hole_number = score_data.get('hole_number')
+                gross_score = score_data.get('gross_score')
+
+                if not is_id(hole_number) or not is_id(gross_score) or not (1 <= hole_number <= 18):
+                    return f'Invalid score data for hole {i+1}.'
+
+            existing_hole_scores = {score.hole_number: score for score in round_data.hole_scores}
+            changed = False
+
+            for score_data in hole_scores_data:
+                hole_number = score_data['hole_number']
+                gross_score = score_data['gross_score']
+
+                hole_par = hole_pars[hole_number - 1]
+                hole_stroke_index = hole_stroke_indices[hole_number - 1]
+
+                # Calculate nett score and Stableford points for the hole
+                handicap_strokes_for_this_hole = calculate_hole_handicap_strokes(round_data.player_playing_handicap, hole_stroke_index)
+                nett_score = gross_score - handicap_strokes_for_this_hole
+                stableford_points = calculate_stableford_points(hole_par, round_data.player_playing_handicap, hole_stroke_index, gross_score)
+
+                hole_score = existing_hole_scores.get(hole_number)
+                if hole_score and (hole_score.gross_score, hole_score.nett_score, hole_score.stableford_points) == (gross_score, nett_score, stableford_points):
+                    continue # Resent unchanged, nothing to write
+                changed = True
+                if hole_score:
+                    gross_delta = gross_score - hole_score.gross_score
+                    nett_delta = nett_score - (hole_score.nett_score or 0)
+                    stableford_delta = stableford_points - (hole_score.stableford_points or 0)
+                    hole_score.gross_score = gross_score
+                    hole_score.nett_score = nett_score
+                    hole_score.stableford_points = stableford_points
+                else:
+                    gross_delta, nett_delta, stableford_delta = gross_score, nett_score, stableford_points
+                    hole_score = HoleScore(
+                        hole_number=hole_number,
+                        gross_score=gross_score,
+                        nett_score=nett_score,
+                        stableford_points=stableford_points
+                    )
+                    round_data.hole_scores.append(hole_score)
+                    existing_hole_scores[hole_number] = hole_score
+
+                # Adjust the summaries by this hole's change rather than re-adding the whole card
+                half = 'front_9' if hole_number <= 9 else 'back_9'
+                for suffix in (half, 'total'):
+                    adjust_summary(round_data, f'gross_score_{suffix}', gross_delta)
+                    adjust_summary(round_data, f'nett_score_{suffix}', nett_delta)
+                    adjust_summary(round_data, f'stableford_{suffix}', stableford_delta)
+
+            # Only real changes count as a new version, so resent scores don't cause conflicts elsewhere
+            if changed:
+                round_data.version += 1
+            return None
+
+        def adjust_summary(round_data, field, delta):
+            # A summary that is still empty (no holes played in that half) starts from zero
+            setattr(round_data, field, (getattr(round_data, field) or 0) + delta)
+
+        def bulk_list(data, key):
+            # The item list of a bulk request body, or None if the body or the list is malformed
+            if not isinstance(data, dict):
+                return None
+            items = data.get(key, [])
+            return items if isinstance(items, list) else None
+
+        def is_id(value):
+            return isinstance(value, int) and not isinstance(value, bool)
+
+        def bulk_item_error(item, fields):
+            # Type-checks one bulk item against {field: (types, description)}, so one bad item
+            # is reported on its own instead of failing the whole batch. Returns an error or None.
+            if not isinstance(item, dict):
+                return 'Item must be an object'
+            for field, (types, description) in fields.items():
+                value = item.get(field)
+                if value is not None and (isinstance(value, bool) or not isinstance(value, types)):
+                    return f'{field} must be {description}'
+            return None
+
+        def find_existing_ids(id_column, ids):
+            # One IN query instead of a lookup per id
+            ids = set(ids)
+            if not ids:
+                return set()
+            return set(db.session.execute(db.select(id_column).where(id_column.in_(ids)).distinct()).scalars())
+
+        def apply_player_membership(tournament_id, add_ids=(), remove_ids=()):
+            # Validates ids with one IN query and applies the diff with a single multi-row
+            # insert and a single delete. Returns a result per requested id.
+            requested_ids = set(filter(is_id, add_ids)) | set(filter(is_id, remove_ids))
+            known_ids = find_existing_ids(player_table.c.id, requested_ids)
+            member_ids = set(db.session.execute(
+                db.select(tournament_players.c.player_id).where(
+                    tournament_players.c.tournament_id == tournament_id,
+                    tournament_players.c.player_id.in_(known_ids)
+                )
+            ).scalars()) if known_ids else set()
+
+            results, ids_to_add, ids_to_remove = [], [], []
+            for player_id in add_ids:
+                if not is_id(player_id):
+                    status = 'invalid'
+                elif player_id not in known_ids:
+                    status = 'not_found'
+                elif player_id in member_ids:
+                    status = 'already_member'
+                else:
+                    status = 'added'
+                    member_ids.add(player_id)
+                    ids_to_add.append(player_id)
+                results.append({'id': player_id, 'action': 'add', 'status': status})
+            for player_id in remove_ids:
+                if not is_id(player_id):
+                    status = 'invalid'
+                elif player_id not in known_ids:
+                    status = 'not_found'
+                elif player_id not in member_ids:
+                    status = 'not_member'
+                else:
+                    status = 'removed'
+                    member_ids.discard(player_id)
+                    ids_to_remove.append(player_id)
+                results.append({'id': player_id, 'action': 'remove', 'status': status})
+
+            if ids_to_add:
+                db.session.execute(tournament_players.insert().values(
+                    [{'tournament_id': tournament_id, 'player_id': player_id} for player_id in ids_to_add]
+                ))
+            if ids_to_remove:
+                db.session.execute(tournament_players.delete().where(
+                    tournament_players.c.tournament_id == tournament_id,
+                    tournament_players.c.player_id.in_(ids_to_remove)
+                ))
+            return results
+
+        COURSE_MEMBERSHIP_FIELDS = {'id': (int, 'an integer'), 'sequence_number': (int, 'an integer')}
+
+        def apply_course_membership(tournament_id, add_items=(), remove_items=()):
+            # Same as apply_player_membership, keyed on (course id, sequence number)
+            def membership_key(item):
+                if bulk_item_error(item, COURSE_MEMBERSHIP_FIELDS):
+                    return None, None
+                return item.get('id'), item.get('sequence_number')
+
+            add_keys = [membership_key(item) for item in add_items]
+            remove_keys = [membership_key(item) for item in remove_items]
+            requested_ids = {course_id for course_id, _ in add_keys + remove_keys if course_id is not None}
+            known_ids = find_existing_ids(course_table.c.id, requested_ids)
+            members = set(tuple(row) for row in db.session.execute(
+                db.select(tournament_courses.c.course_id, tournament_courses.c.sequence_number)
+                  .where(tournament_courses.c.tournament_id == tournament_id)
+            ))
+
+            results, rows_to_add, rows_to_remove = [], [], []
+            for key in add_keys:
+                if key[0] is None or key[1] is None:
+                    status = 'invalid'
+                elif key[0] not in known_ids:
+                    status = 'not_found'
+                elif key in members:
+                    status = 'already_member'
+                else:
+                    status = 'added'
+                    members.add(key)
+                    rows_to_add.append(key)
+                results.append({'id': key[0], 'sequence_number': key[1], 'action': 'add', 'status': status})
+            for key in remove_keys:
+                if key[0] is None:
+                    status = 'invalid'
+                elif key[0] not in known_ids:
+                    status = 'not_found'
+                elif key not in members:
+                    status = 'not_member'
+                else:
+                    status = 'removed'
+                    members.discard(key)
+                    rows_to_remove.append(key)
+                results.append({'id': key[0], 'sequence_number': key[1], 'action': 'remove', 'status': status})
+
+            if rows_to_add:
+                db.session.execute(tournament_courses.insert().values(
+                    [{'tournament_id': tournament_id, 'course_id': course_id, 'sequence_number': sequence_number}
+                     for course_id, sequence_number in rows_to_add]
+                ))
+            if rows_to_remove:
+                db.session.execute(tournament_courses.delete().where(
+                    tournament_courses.c.tournament_id == tournament_id,
+                    db.tuple_(tournament_courses.c.course_id, tournament_courses.c.sequence_number).in_(rows_to_remove)
+                ))
+            return results
+
         def calculate_hole_handicap_strokes(playing_handicap, hole_stroke_index):
             handicap_strokes = 0
             if playing_handicap is not None and hole_stroke_index is not None:
@@ -882,6 +2263,83 @@ def create_app():
             db.session.commit()
             return '', 204
 
+        @app.route('/rankings', methods=['GET'])
+        def get_rankings():
+            # Order of merit for a season, defaulting to the latest one
+            season = request.args.get('season')
+            page = request.args.get('page', 1, type=int)
+            per_page = request.args.get('per_page', 20, type=int)
+
+            if not season:
+                season = db.session.execute(
+                    db.select(PlayerRanking.season).where(PlayerRanking.season != 'undated').order_by(PlayerRanking.season.desc()).limit(1)
+                ).scalar() or 'undated'
+
+            pagination = (PlayerRanking.query
+                            .filter_by(season=season)
+                            .join(Player)
+                            .options(db.contains_eager(PlayerRanking.player))
+                            .order_by(PlayerRanking.points.desc(), PlayerRanking.wins.desc(), Player.name)
+                            .paginate(page=page, per_page=per_page, max_per_page=100, error_out=False))
+
+            first_rank = (pagination.page - 1) * pagination.per_page + 1
+            return jsonify({
+                'season': season,
+                'page': pagination.page,
+                'per_page': pagination.per_page,
+                'total': pagination.total,
+                'pages': pagination.pages,
+                'rankings': [{
+                    'rank': first_rank + i,
+                    'player_id': ranking.player_id,
+                    'player_name': ranking.player.name,
+                    'points': ranking.points,
+                    'events': ranking.events,
+                    'wins': ranking.wins
+                } for i, ranking in enumerate(pagination.items)]
+            })
+
+        @app.route('/merit_points', methods=['GET'])
+        def get_merit_points():
+            merit_points = MeritPoints.query.order_by(MeritPoints.position).all()
+            return jsonify([entry.to_dict() for entry in merit_points])
+
+        @app.route('/merit_points', methods=['POST'])
+        def add_merit_points():
+            data = request.get_json()
+            if not data or 'position' not in data or 'points' not in data:
+                return jsonify({'error': 'Position and points are required'}), 400
+
+            existing_entry = MeritPoints.query.get(data['position'])
+            if existing_entry:
+                return jsonify({'error': 'Points for this position already exist'}), 409 # Conflict
+
+            new_entry = MeritPoints(position=data['position'], points=data['points'])
+            db.session.add(new_entry)
+            recompute_ranking_points()
+            db.session.commit()
+            return jsonify(new_entry.to_dict()), 201
+
+        @app.route('/merit_points/<int:position>', methods=['PUT'])
+        def update_merit_points(position):
+            entry = MeritPoints.query.get_or_404(position)
+            data = request.get_json()
+
+            if 'points' in data:
+                entry.points = data['points']
+
+            recompute_ranking_points()
+            db.session.commit()
+            return jsonify(entry.to_dict())
+
+        @app.route('/merit_points/<int:position>', methods=['DELETE'])
+        def delete_merit_points(position):
+            entry = MeritPoints.query.get_or_404(position)
+            db.session.delete(entry)
+            recompute_ranking_points()
+            db.session.commit()
+            return '', 204
+
     return app
 
 app = create_app()
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""Times the read-heavy endpoints against the old ORM/to_dict serialization.
+
+Seeds a throwaway SQLite database with 10 tournaments x 4 rounds x 40 players
+(1,600 rounds, 18 hole scores each) and reports CPU time per request for
+GET /rounds, GET /tournaments and GET /tournaments/<id>/rounds_summary.
+
+    python bench_serialization.py [repeats]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+DB_PATH = os.path.join(tempfile.mkdtemp(prefix='golfapp-bench-'), 'bench.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{DB_PATH}'
+os.environ.pop('DATABASE_REPLICA_URL', None)
+
+import app as golf_app  # noqa: E402
+
+from sqlalchemy.orm import joinedload  # noqa: E402
+
+TOURNAMENTS = 10
+COURSES = 4
+PLAYERS = 40
+
+app = golf_app.app
+db = golf_app.db
+models = db.Model.registry._class_registry
+Round, Tournament, Player, Course, HoleScore = (
+    models['Round'], models['Tournament'], models['Player'], models['Course'], models['HoleScore']
+)
+
+
+def seed():
+    db.create_all()
+    tournament_courses = db.metadata.tables['tournament_courses']
+    courses = [Course(name=f'Course {i}', slope_rating=113, hole_pars=json.dumps([4] * 18),
+                      hole_stroke_indices=json.dumps(list(range(1, 19)))) for i in range(COURSES)]
+    players = [Player(name=f'Player {i}', handicap=10.0) for i in range(PLAYERS)]
+    db.session.add_all(courses + players)
+    db.session.flush()
+
+    for t in range(TOURNAMENTS):
+        tournament = Tournament(name=f'Tournament {t}', date='2026-06-01')
+        tournament.players = players
+        db.session.add(tournament)
+        db.session.flush()
+        for sequence_number, course in enumerate(courses, start=1):
+            db.session.execute(tournament_courses.insert().values(
+                tournament_id=tournament.id, course_id=course.id, sequence_number=sequence_number))
+            for player in players:
+                new_round = Round(tournament_id=tournament.id, player_id=player.id, course_id=course.id,
+                                  round_number=sequence_number, date_played='2026-06-01',
+                                  gross_score_total=90, nett_score_total=80, stableford_total=36)
+                new_round.hole_scores = [HoleScore(hole_number=h, gross_score=5, nett_score=4, stableford_points=2)
+                                         for h in range(1, 19)]
+                db.session.add(new_round)
+    db.session.commit()
+
+
+# The serialization as it was before the Core/orjson fast path: ORM objects,
+# to_dict and Flask's default (stdlib, sorted keys) JSON encoder
+def orm_rounds():
+    rounds = Round.query.options(joinedload(Round.hole_scores)).all()
+    return json.dumps([r.to_dict() for r in rounds], sort_keys=True)
+
+
+def orm_tournaments():
+    return json.dumps([t.to_dict() for t in Tournament.query.all()], sort_keys=True)
+
+
+def orm_rounds_summary():
+    rounds = Round.query.filter_by(tournament_id=1).options(joinedload(Round.player), joinedload(Round.course)).all()
+    rounds_data = []
+    for r in rounds:
+        round_dict = r.to_dict()
+        round_dict['player_name'] = r.player.name
+        round_dict['course_name'] = r.course.name
+        rounds_data.append(round_dict)
+    return json.dumps(rounds_data, sort_keys=True)
+
+
+def cpu_ms(fn, repeats):
+    start = time.process_time()
+    for _ in range(repeats):
+        fn()
+    return (time.process_time() - start) / repeats * 1000
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with app.app_context():
+        seed()
+
+    client = app.test_client()
+    cases = [
+        ('/rounds', orm_rounds, '/rounds'),
+        ('/tournaments', orm_tournaments, '/tournaments'),
+        ('rounds_summary', orm_rounds_summary, '/tournaments/1/rounds_summary'),
+    ]
+    print(f'{TOURNAMENTS * COURSES * PLAYERS} rounds, orjson {"on" if golf_app.orjson else "off"}, {repeats} repeats')
+    for name, orm_path, url in cases:
+        def old():
+            with app.app_context():
+                orm_path()
+                db.session.remove()
+
+        def new():
+            # get_data drains streamed responses so the full encode is timed
+            client.get(url, headers={'Accept-Encoding': 'identity'}).get_data()
+
+        print(f'{name:15} ORM/to_dict {cpu_ms(old, repeats):8.1f} ms   Core/orjson {cpu_ms(new, repeats):8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""baseline schema
+
+Revision ID: 3f1c2a9b7d10
+Revises: 
+Create Date: 2026-10-19 15:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9b7d10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases deployed before the migrations were checked in already have
+    # these tables; only create the ones that are missing
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'player' not in existing_tables:
+        op.create_table('player',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=80), nullable=False),
+        sa.Column('handicap', sa.Float(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name')
+        )
+    if 'course' not in existing_tables:
+        op.create_table('course',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=120), nullable=False),
+        sa.Column('country', sa.String(length=80), nullable=True),
+        sa.Column('slope_rating', sa.Float(), nullable=True),
+        sa.Column('hole_pars', sa.String(length=500), nullable=True),
+        sa.Column('hole_stroke_indices', sa.String(length=500), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name')
+        )
+    if 'tournament' not in existing_tables:
+        op.create_table('tournament',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=120), nullable=False),
+        sa.Column('date', sa.String(length=80), nullable=True),
+        sa.Column('location', sa.String(length=120), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name')
+        )
+    if 'handicap_adjustment' not in existing_tables:
+        op.create_table('handicap_adjustment',
+        sa.Column('stableford_score', sa.Integer(), nullable=False),
+        sa.Column('adjustment', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('stableford_score')
+        )
+    if 'tournament_players' not in existing_tables:
+        op.create_table('tournament_players',
+        sa.Column('tournament_id', sa.Integer(), nullable=False),
+        sa.Column('player_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['player_id'], ['player.id'], ),
+        sa.ForeignKeyConstraint(['tournament_id'], ['tournament.id'], ),
+        sa.PrimaryKeyConstraint('tournament_id', 'player_id')
+        )
+    if 'tournament_courses' not in existing_tables:
+        op.create_table('tournament_courses',
+        sa.Column('tournament_id', sa.Integer(), nullable=False),
+        sa.Column('course_id', sa.Integer(), nullable=False),
+        sa.Column('sequence_number', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['course_id'], ['course.id'], ),
+        sa.ForeignKeyConstraint(['tournament_id'], ['tournament.id'], ),
+        sa.PrimaryKeyConstraint('tournament_id', 'course_id', 'sequence_number')
+        )
+    if 'round' not in existing_tables:
+        op.create_table('round',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('tournament_id', sa.Integer(), nullable=False),
+        sa.Column('player_id', sa.Integer(), nullable=False),
+        sa.Column('course_id', sa.Integer(), nullable=False),
+        sa.Column('round_number', sa.Integer(), nullable=False),
+        sa.Column('date_played', sa.String(length=80), nullable=False),
+        sa.Column('player_handicap_index', sa.Float(), nullable=True),
+        sa.Column('player_playing_handicap', sa.Integer(), nullable=True),
+        sa.Column('is_finalized', sa.Boolean(), nullable=False),
+        sa.Column('gross_score_front_9', sa.Integer(), nullable=True),
+        sa.Column('nett_score_front_9', sa.Integer(), nullable=True),
+        sa.Column('stableford_front_9', sa.Integer(), nullable=True),
+        sa.Column('gross_score_back_9', sa.Integer(), nullable=True),
+        sa.Column('nett_score_back_9', sa.Integer(), nullable=True),
+        sa.Column('stableford_back_9', sa.Integer(), nullable=True),
+        sa.Column('gross_score_total', sa.Integer(), nullable=True),
+        sa.Column('nett_score_total', sa.Integer(), nullable=True),
+        sa.Column('stableford_total', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['course_id'], ['course.id'], ),
+        sa.ForeignKeyConstraint(['player_id'], ['player.id'], ),
+        sa.ForeignKeyConstraint(['tournament_id'], ['tournament.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+    if 'hole_score' not in existing_tables:
+        op.create_table('hole_score',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('round_id', sa.Integer(), nullable=False),
+        sa.Column('hole_number', sa.Integer(), nullable=False),
+        sa.Column('gross_score', sa.Integer(), nullable=False),
+        sa.Column('nett_score', sa.Integer(), nullable=True),
+        sa.Column('stableford_points', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['round_id'], ['round.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+
+def downgrade():
+    op.drop_table('hole_score')
+    op.drop_table('round')
+    op.drop_table('tournament_courses')
+    op.drop_table('tournament_players')
+    op.drop_table('handicap_adjustment')
+    op.drop_table('tournament')
+    op.drop_table('course')
+    op.drop_table('player')
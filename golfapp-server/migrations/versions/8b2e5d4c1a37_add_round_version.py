@@ -0,0 +1,27 @@
+"""add round version
+
+Revision ID: 8b2e5d4c1a37
+Revises: 3f1c2a9b7d10
+Create Date: 2026-10-19 15:21:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2e5d4c1a37'
+down_revision = '3f1c2a9b7d10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rounds start at version 1, the same as newly created ones
+    with op.batch_alter_table('round', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('round', schema=None) as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,40 @@
+"""add trigram search indexes
+
+Revision ID: d5e81b3a9c24
+Revises: c47a9e2f6b58
+Create Date: 2026-10-19 15:23:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5e81b3a9c24'
+down_revision = 'c47a9e2f6b58'
+branch_labels = None
+depends_on = None
+
+TRIGRAM_INDEXES = [
+    ('ix_player_name_trgm', 'player', 'name'),
+    ('ix_course_name_trgm', 'course', 'name'),
+    ('ix_course_country_trgm', 'course', 'country'),
+]
+
+
+def upgrade():
+    # The search endpoints only use pg_trgm on Postgres; elsewhere they fall
+    # back to the in-process index and need nothing here
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(name, table, [column], unique=False,
+                        postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'})
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for name, table, column in TRIGRAM_INDEXES:
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,50 @@
+"""add order of merit tables
+
+Revision ID: e9a3c6f2d715
+Revises: d5e81b3a9c24
+Create Date: 2026-10-19 15:24:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e9a3c6f2d715'
+down_revision = 'd5e81b3a9c24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('merit_points',
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('points', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('position')
+    )
+    op.create_table('tournament_result',
+    sa.Column('tournament_id', sa.Integer(), nullable=False),
+    sa.Column('player_id', sa.Integer(), nullable=False),
+    sa.Column('season', sa.String(length=20), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('stableford_total', sa.Integer(), nullable=False),
+    sa.Column('points', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['player_id'], ['player.id'], ),
+    sa.ForeignKeyConstraint(['tournament_id'], ['tournament.id'], ),
+    sa.PrimaryKeyConstraint('tournament_id', 'player_id')
+    )
+    op.create_table('player_ranking',
+    sa.Column('season', sa.String(length=20), nullable=False),
+    sa.Column('player_id', sa.Integer(), nullable=False),
+    sa.Column('points', sa.Float(), nullable=False),
+    sa.Column('events', sa.Integer(), nullable=False),
+    sa.Column('wins', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['player_id'], ['player.id'], ),
+    sa.PrimaryKeyConstraint('season', 'player_id')
+    )
+
+
+def downgrade():
+    op.drop_table('player_ranking')
+    op.drop_table('tournament_result')
+    op.drop_table('merit_points')
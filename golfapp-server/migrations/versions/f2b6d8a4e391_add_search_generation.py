@@ -0,0 +1,30 @@
+"""add search generation
+
+Revision ID: f2b6d8a4e391
+Revises: e9a3c6f2d715
+Create Date: 2026-10-19 15:25:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b6d8a4e391'
+down_revision = 'e9a3c6f2d715'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    search_generation = op.create_table('search_generation',
+    sa.Column('name', sa.String(length=20), nullable=False),
+    sa.Column('generation', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    # Seeded so the first writes only ever update (and lock) an existing row
+    op.bulk_insert(search_generation, [{'name': 'player', 'generation': 0}, {'name': 'course', 'generation': 0}])
+
+
+def downgrade():
+    op.drop_table('search_generation')
@@ -0,0 +1,95 @@
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+from flask.testing import FlaskClient
+
+# app.py builds the app at import time from the environment, so point it at
+# throwaway primary and replica SQLite files before importing it
+DB_DIR = tempfile.mkdtemp(prefix='golfapp-tests-')
+PRIMARY_PATH = os.path.join(DB_DIR, 'primary.db')
+REPLICA_PATH = os.path.join(DB_DIR, 'replica.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{PRIMARY_PATH}'
+os.environ['DATABASE_REPLICA_URL'] = f'sqlite:///{REPLICA_PATH}'
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as golf_app  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    flask_app = golf_app.app
+    with flask_app.app_context():
+        golf_app.db.drop_all()
+        golf_app.db.create_all()
+    yield flask_app
+    with flask_app.app_context():
+        golf_app.db.session.remove()
+
+
+class StickyClient(FlaskClient):
+    # Sends back the read-your-writes deadline from the last write, like the web client does
+    read_primary_until = None
+
+    def open(self, *args, **kwargs):
+        if self.read_primary_until:
+            kwargs['headers'] = {golf_app.PRIMARY_STICKY_HEADER: self.read_primary_until, **(kwargs.get('headers') or {})}
+        response = super().open(*args, **kwargs)
+        self.read_primary_until = response.headers.get(golf_app.PRIMARY_STICKY_HEADER, self.read_primary_until)
+        return response
+
+
+@pytest.fixture
+def client(app):
+    return StickyClient(app, app.response_class, use_cookies=True)
+
+
+@pytest.fixture
+def replicate(app):
+    # Stand-in for replication: copy the primary over the replica
+    def copy_primary_to_replica():
+        with app.app_context():
+            golf_app.db.engines['replica'].dispose()
+        shutil.copyfile(PRIMARY_PATH, REPLICA_PATH)
+    return copy_primary_to_replica
+
+
+@pytest.fixture
+def models(app):
+    return golf_app.db.Model.registry._class_registry
+
+
+HOLES = 18
+
+
+@pytest.fixture
+def make_tournament(client):
+    # Players, one par-72 course per round and a tournament they are all entered in
+    def make(name='Open', players=(('Alice', 10.0), ('Bob', 20.0)), rounds=1, date=None):
+        player_ids = [client.post('/players', json={'name': player_name, 'handicap': handicap}).get_json()['id']
+                      for player_name, handicap in players]
+        course_ids = [client.post('/courses', json={
+            'name': f'{name} course {number}', 'slope_rating': 113,
+            'hole_pars': [4] * HOLES, 'hole_stroke_indices': list(range(1, HOLES + 1)),
+        }).get_json()['id'] for number in range(1, rounds + 1)]
+        tournament_id = client.post('/tournaments', json={'name': name, 'date': date}).get_json()['id']
+        client.post(f'/tournaments/{tournament_id}/players', json={'player_ids': player_ids})
+        client.post(f'/tournaments/{tournament_id}/courses', json={'courses': [
+            {'id': course_id, 'sequence_number': number} for number, course_id in enumerate(course_ids, start=1)
+        ]})
+        return {'id': tournament_id, 'player_ids': player_ids, 'course_ids': course_ids}
+    return make
+
+
+@pytest.fixture
+def initiate_round(client):
+    # Starts a tournament's round for all its players; returns the new rounds
+    def initiate(tournament, round_number=1):
+        return client.post('/initiate_round', json={
+            'tournament_id': tournament['id'], 'course_id': tournament['course_ids'][round_number - 1],
+            'sequence_number': round_number, 'players_data': [{'player_id': player_id} for player_id in tournament['player_ids']],
+        }).get_json()['rounds']
+    return initiate
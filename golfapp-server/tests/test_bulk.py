@@ -0,0 +1,91 @@
+def statuses(response):
+    return [result['status'] for result in response.get_json()['results']]
+
+
+def test_bulk_post_reports_malformed_items_and_applies_the_rest(client):
+    response = client.post('/players/bulk', json={'players': [
+        'Bob', {'name': ['Bob']}, {'name': 'Carol', 'handicap': 'low'}, {}, {'name': 'Dave', 'handicap': 4.2},
+    ]})
+
+    assert response.status_code == 200
+    assert statuses(response) == ['invalid', 'invalid', 'invalid', 'invalid', 'created']
+    assert [player['name'] for player in client.get('/players').get_json()] == ['Dave']
+
+    response = client.post('/courses/bulk', json={'courses': [7, {'name': 'Links', 'hole_pars': 'four'}, {'name': 'Links'}]})
+    assert statuses(response) == ['invalid', 'invalid', 'created']
+
+
+def test_bulk_endpoints_reject_a_body_without_a_list(client):
+    tournament_id = client.post('/tournaments', json={'name': 'Open'}).get_json()['id']
+
+    assert client.post('/players/bulk', json={'players': 'Bob'}).status_code == 400
+    assert client.patch('/players/bulk', json=['Bob']).status_code == 400
+    assert client.delete('/players/bulk', json={'player_ids': 3}).status_code == 400
+    assert client.post('/courses/bulk', json={'courses': {'name': 'Links'}}).status_code == 400
+    assert client.patch(f'/tournaments/{tournament_id}/players', json={'add': 1}).status_code == 400
+    assert client.post(f'/tournaments/{tournament_id}/courses', json={'courses': None}).status_code == 400
+
+
+def test_bulk_patch_reports_empty_names_as_invalid(client):
+    client.post('/players/bulk', json={'players': [{'name': 'Alice'}, {'name': 'Bob'}]})
+    client.post('/courses/bulk', json={'courses': [{'name': 'Links'}]})
+
+    response = client.patch('/players/bulk', json={'players': [
+        {'id': 1, 'name': None},
+        {'id': 2, 'name': ''},
+        {'id': 2, 'handicap': 3.0},
+        {'id': '2', 'handicap': 1.0},
+        'Bob',
+        {'id': 1, 'name': {'first': 'Al'}},
+    ]})
+
+    assert response.status_code == 200
+    assert statuses(response) == ['invalid', 'invalid', 'updated', 'invalid', 'invalid', 'invalid']
+    assert [(player['name'], player['handicap']) for player in client.get('/players').get_json()] == [('Alice', None), ('Bob', 3.0)]
+
+    response = client.patch('/courses/bulk', json={'courses': [{'id': 1, 'name': None}]})
+    assert response.get_json()['results'][0]['status'] == 'invalid'
+
+
+def test_bulk_delete_keeps_players_and_courses_with_rounds(client, make_tournament, initiate_round):
+    tournament = make_tournament()
+    initiate_round(tournament)
+    spare_player = client.post('/players', json={'name': 'Carol'}).get_json()['id']
+    spare_course = client.post('/courses', json={'name': 'Spare'}).get_json()['id']
+
+    response = client.delete('/players/bulk', json={'player_ids': [tournament['player_ids'][0], spare_player, 999, 'x']})
+    assert statuses(response) == ['in_use', 'deleted', 'not_found', 'invalid']
+    assert [player['name'] for player in client.get('/players').get_json()] == ['Alice', 'Bob']
+
+    response = client.delete('/courses/bulk', json={'course_ids': [tournament['course_ids'][0], spare_course]})
+    assert statuses(response) == ['in_use', 'deleted']
+
+
+def test_membership_patch_applies_a_diff(client, make_tournament):
+    tournament = make_tournament(players=(('Alice', 10.0), ('Bob', 20.0)))
+    alice, bob = tournament['player_ids']
+    carol = client.post('/players', json={'name': 'Carol'}).get_json()['id']
+
+    response = client.patch(f"/tournaments/{tournament['id']}/players", json={
+        'add': [carol, alice, 999, [carol]], 'remove': [bob, carol, 'x'],
+    })
+    assert response.get_json()['results'] == [
+        {'id': carol, 'action': 'add', 'status': 'added'},
+        {'id': alice, 'action': 'add', 'status': 'already_member'},
+        {'id': 999, 'action': 'add', 'status': 'not_found'},
+        {'id': [carol], 'action': 'add', 'status': 'invalid'},
+        {'id': bob, 'action': 'remove', 'status': 'removed'},
+        {'id': carol, 'action': 'remove', 'status': 'removed'},
+        {'id': 'x', 'action': 'remove', 'status': 'invalid'},
+    ]
+    members = client.get(f"/tournaments/{tournament['id']}/players").get_json()
+    assert [player['name'] for player in members] == ['Alice']
+
+    course = tournament['course_ids'][0]
+    response = client.patch(f"/tournaments/{tournament['id']}/courses", json={
+        'add': [{'id': course, 'sequence_number': 2}, {'id': course, 'sequence_number': 1}, {'id': course}, 'Links'],
+        'remove': [{'id': course, 'sequence_number': 1}, {'id': 999, 'sequence_number': 1}],
+    })
+    assert statuses(response) == ['added', 'already_member', 'invalid', 'invalid', 'removed', 'not_found']
+    courses = client.get(f"/tournaments/{tournament['id']}/courses").get_json()
+    assert [course['sequence_number'] for course in courses] == [2]
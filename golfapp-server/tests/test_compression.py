@@ -0,0 +1,90 @@
+import gzip
+import json
+
+import pytest
+
+import app as golf_app
+
+
+@pytest.fixture
+def played_rounds(client, make_tournament, initiate_round):
+    # Enough players, rounds and hole scores that every body is well over COMPRESS_MIN_SIZE
+    tournament = make_tournament(players=[(f'Player number {number}', 10.0) for number in range(40)])
+    for r in initiate_round(tournament):
+        client.patch(f"/rounds/{r['id']}/scores", json={'hole_scores': [
+            {'hole_number': hole_number, 'gross_score': 4} for hole_number in range(1, 10)
+        ]})
+    return tournament
+
+
+def get(client, path, encoding):
+    return client.get(path, headers={'Accept-Encoding': encoding})
+
+
+def test_encoding_is_negotiated_from_accept_encoding(client, played_rounds):
+    assert get(client, '/rounds', 'gzip').headers['Content-Encoding'] == 'gzip'
+    assert get(client, '/rounds', 'gzip;q=1.0, br;q=0.5').headers['Content-Encoding'] == 'gzip'
+    assert get(client, '/rounds', 'deflate').headers.get('Content-Encoding') is None
+    assert get(client, '/rounds', 'identity').headers.get('Content-Encoding') is None
+
+    response = get(client, '/rounds', 'gzip, br')
+    assert response.headers['Content-Encoding'] == ('br' if golf_app.brotli else 'gzip')
+    assert 'Accept-Encoding' in response.headers['Vary']
+
+
+@pytest.mark.parametrize('encoding', ['gzip', 'br'])
+@pytest.mark.parametrize('path', ['/rounds', '/rounds?format=columnar', '/tournaments?format=columnar'])
+def test_streamed_bodies_round_trip(client, played_rounds, encoding, path):
+    if encoding == 'br':
+        brotli = pytest.importorskip('brotli')
+        decompress = brotli.decompress
+    else:
+        decompress = gzip.decompress
+    plain = get(client, path, 'identity')
+
+    response = get(client, path, encoding)
+
+    assert response.headers['Content-Encoding'] == encoding
+    assert 'Content-Length' not in response.headers
+    assert decompress(response.data) == plain.data
+    assert len(response.data) < len(plain.data)
+
+
+def test_small_streamed_bodies_are_not_compressed(client, replicate):
+    replicate()
+    response = get(client, '/rounds', 'gzip, br')
+
+    assert response.headers.get('Content-Encoding') is None
+    assert response.get_json() == []
+    assert response.headers['Content-Length'] == '2'
+
+
+def test_columnar_tournaments_match_the_plain_form(client, make_tournament, monkeypatch):
+    monkeypatch.setitem(golf_app.app.config, 'STREAM_BATCH_SIZE', 2)  # Several keyset batches per section
+    make_tournament(name='Open', players=(('Alice', 10.0), ('Bob', 20.0)), rounds=2)
+    make_tournament(name='Masters', players=(('Carol', 5.0), ('Dave', 8.0), ('Erin', 12.0)))
+    client.post('/tournaments/1/players', json={'player_ids': [3]})
+    client.post('/tournaments', json={'name': 'Empty'})
+
+    columnar = json.loads(get(client, '/tournaments?format=columnar', 'identity').data)
+    plain = client.get('/tournaments').get_json()
+
+    assert set(columnar) == {'players', 'courses', 'columns', 'rows'}
+    players = {row[0]: dict(zip(columnar['players']['columns'], row)) for row in columnar['players']['rows']}
+    courses = {row[0]: dict(zip(columnar['courses']['columns'], row)) for row in columnar['courses']['rows']}
+    assert len(players) == len(columnar['players']['rows']) == 5
+    assert len(courses) == len(columnar['courses']['rows']) == 3
+
+    rebuilt = []
+    for row in columnar['rows']:
+        tournament = dict(zip(columnar['columns'], row))
+        tournament['players'] = [players[player_id] for player_id in tournament.pop('player_ids')]
+        tournament['courses'] = [{**courses[course_id], 'sequence_number': sequence_number}
+                                 for course_id, sequence_number in tournament['courses']]
+        rebuilt.append(tournament)
+
+    def by_id(items):
+        return sorted(items, key=lambda item: item['id'])
+    assert [t['name'] for t in rebuilt] == ['Open', 'Masters', 'Empty']
+    assert [{**t, 'players': by_id(t['players']), 'courses': by_id(t['courses'])} for t in rebuilt] == \
+        [{**t, 'players': by_id(t['players']), 'courses': by_id(t['courses'])} for t in plain]
@@ -0,0 +1,83 @@
+import random
+import threading
+
+from app import db
+
+HOLES = 18
+THREADS = 60
+
+
+def seed_round(client):
+    players = [client.post('/players', json={'name': name, 'handicap': handicap}).get_json()
+               for name, handicap in (('Alice', 10.0), ('Bob', 20.0))]
+    course = client.post('/courses', json={'name': 'Links', 'country': 'Scotland', 'slope_rating': 113,
+                                           'hole_pars': [4] * HOLES, 'hole_stroke_indices': list(range(1, HOLES + 1))}).get_json()
+    tournament = client.post('/tournaments', json={'name': 'Open'}).get_json()
+    client.post(f"/tournaments/{tournament['id']}/players", json={'player_ids': [player['id'] for player in players]})
+    client.post(f"/tournaments/{tournament['id']}/courses", json={'courses': [{'id': course['id'], 'sequence_number': 1}]})
+    # A distinct, non-zero adjustment for every reachable score, so a handicap adjusted
+    # twice or from the wrong total shows up
+    for stableford_score in range(5 * HOLES + 1):
+        client.post('/handicap_adjustments', json={'stableford_score': stableford_score,
+                                                   'adjustment': round(0.1 * (stableford_score + 1), 1)})
+    rounds = client.post('/initiate_round', json={
+        'tournament_id': tournament['id'], 'course_id': course['id'], 'sequence_number': 1,
+        'players_data': [{'player_id': player['id']} for player in players],
+    }).get_json()['rounds']
+    for round_data in rounds:
+        client.post(f"/rounds/{round_data['id']}/scores",
+                    json={'hole_scores': [{'hole_number': hole, 'gross_score': 5} for hole in range(1, HOLES + 1)]})
+    return tournament, rounds
+
+
+def test_end_round_races_score_writes(app, client, models):
+    tournament, rounds = seed_round(client)
+    statuses = {'end': [], 'score': []}
+    errors = []
+
+    def end_round():
+        response = app.test_client().post(f"/tournaments/{tournament['id']}/rounds/end", json={'round_number': 1})
+        statuses['end'].append(response.status_code)
+
+    def write_scores(seed):
+        rng = random.Random(seed)
+        round_id = rng.choice(rounds)['id']
+        gross_score = rng.randint(3, 7)
+        if seed % 2:
+            hole_scores = [{'hole_number': hole, 'gross_score': gross_score} for hole in range(1, HOLES + 1)]
+            response = app.test_client().post(f'/rounds/{round_id}/scores', json={'hole_scores': hole_scores})
+        else:
+            hole_scores = [{'hole_number': rng.randint(1, HOLES), 'gross_score': gross_score}]
+            response = app.test_client().patch(f'/rounds/{round_id}/scores', json={'hole_scores': hole_scores})
+        statuses['score'].append(response.status_code)
+
+    def run(target, *args):
+        try:
+            target(*args)
+        except Exception as error:  # Surfaced by the assertion below rather than lost in the thread
+            errors.append(error)
+
+    threads = [threading.Thread(target=run, args=(end_round,) if i % 6 == 0 else (write_scores, i)) for i in range(THREADS)]
+    random.Random(0).shuffle(threads)
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert set(statuses['end']) == {200}
+    # Writes that lose the race with end_round are refused, never half-applied
+    assert set(statuses['score']) <= {200, 409}
+
+    Round, Player, HandicapAdjustment = models['Round'], models['Player'], models['HandicapAdjustment']
+    with app.app_context():
+        adjustments = {a.stableford_score: a.adjustment for a in HandicapAdjustment.query.all()}
+        for finished in Round.query.all():
+            holes = finished.hole_scores
+            assert finished.is_finalized
+            assert len(holes) == HOLES
+            assert finished.gross_score_total == sum(hole.gross_score for hole in holes)
+            assert finished.stableford_total == sum(hole.stableford_points for hole in holes)
+            # Adjusted exactly once, from the finalized total
+            expected = round(finished.player_handicap_index + adjustments[finished.stableford_total], 1)
+            assert db.session.get(Player, finished.player_id).handicap == expected
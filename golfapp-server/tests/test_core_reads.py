@@ -0,0 +1,82 @@
+import pytest
+
+from app import db
+
+
+@pytest.fixture
+def scored_tournaments(client, make_tournament, initiate_round):
+    # Finished, partly scored and unscored rounds, a player without a handicap and a
+    # tournament with no players or courses, so nulls and empty lists are covered too
+    open_ = make_tournament(name='Open', players=(('Alice', 10.0), ('Bob', 20.0), ('Carol', 5.0)), rounds=2, date='2026-06-01')
+    for r in initiate_round(open_):
+        client.post(f"/rounds/{r['id']}/scores", json={'hole_scores': [
+            {'hole_number': hole_number, 'gross_score': 3 + hole_number % 3} for hole_number in range(18, 0, -1)
+        ]})
+    client.post(f"/tournaments/{open_['id']}/rounds/end", json={'round_number': 1})
+    second_round = initiate_round(open_, 2)
+    client.patch(f"/rounds/{second_round[0]['id']}/scores", json={'hole_scores': [
+        {'hole_number': 12, 'gross_score': 5}, {'hole_number': 3, 'gross_score': 4},
+    ]})
+
+    masters = make_tournament(name='Masters', players=(('Dave', 8.0),))
+    client.post('/players', json={'name': 'Erin'})
+    client.post(f"/tournaments/{masters['id']}/players", json={'player_ids': [5]})
+    initiate_round(masters)
+    client.post('/tournaments', json={'name': 'Empty', 'location': 'Nowhere'})
+    return open_, masters
+
+
+def normalized(dicts):
+    # to_dict leaves the order of related rows (hole scores, players, courses) to the
+    # relationship loading, so those lists are compared in a fixed order; the top-level
+    # order and everything else must match exactly
+    def related_in_fixed_order(value):
+        if isinstance(value, list) and value and isinstance(value[0], dict):
+            return sorted((related_in_fixed_order(item) for item in value), key=lambda item: (item['id'], item.get('sequence_number')))
+        if isinstance(value, dict):
+            return {key: related_in_fixed_order(item) for key, item in value.items()}
+        return value
+    return [{key: related_in_fixed_order(item) for key, item in d.items()} for d in dicts]
+
+
+def round_dict_with_names(round_data):
+    round_dict = round_data.to_dict()
+    round_dict['player_name'] = round_data.player.name if round_data.player else 'Unknown Player'
+    round_dict['course_name'] = round_data.course.name if round_data.course else 'Unknown Course'
+    return round_dict
+
+
+@pytest.mark.parametrize('batch_size', [200, 2])
+def test_core_reads_match_the_model_to_dict(app, client, models, scored_tournaments, monkeypatch, batch_size):
+    monkeypatch.setitem(app.config, 'STREAM_BATCH_SIZE', batch_size)
+    open_, masters = scored_tournaments
+    Round, Tournament = models['Round'], models['Tournament']
+
+    with app.app_context():
+        rounds = Round.query.order_by(Round.id).all()
+        expected_rounds = [r.to_dict() for r in rounds]
+        expected_alice_rounds = [r.to_dict() for r in rounds if r.tournament_id == open_['id'] and r.player_id == open_['player_ids'][0]]
+        expected_summaries = {tournament['id']: [round_dict_with_names(r) for r in rounds if r.tournament_id == tournament['id']]
+                              for tournament in (open_, masters)}
+        expected_tournaments = [t.to_dict() for t in Tournament.query.order_by(Tournament.id).all()]
+        db.session.remove()
+
+    assert len(expected_rounds) == 7
+    assert normalized(client.get('/rounds').get_json()) == normalized(expected_rounds)
+    assert normalized(client.get('/rounds', query_string={
+        'tournament_id': open_['id'], 'player_ids': f"{open_['player_ids'][0]},999"
+    }).get_json()) == normalized(expected_alice_rounds)
+    for tournament_id, expected in expected_summaries.items():
+        assert normalized(client.get(f'/tournaments/{tournament_id}/rounds_summary').get_json()) == normalized(expected)
+
+    assert normalized(client.get('/tournaments').get_json()) == normalized(expected_tournaments)
+    for expected in expected_tournaments:
+        assert normalized([client.get(f"/tournaments/{expected['id']}").get_json()]) == normalized([expected])
+
+
+def test_hole_scores_are_listed_in_hole_order(client, scored_tournaments):
+    for round_dict in client.get('/rounds').get_json():
+        hole_numbers = [score['hole_number'] for score in round_dict['hole_scores']]
+        assert hole_numbers == sorted(hole_numbers)
+        assert round_dict['thru'] == len(hole_numbers)
+
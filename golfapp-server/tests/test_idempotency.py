@@ -0,0 +1,39 @@
+import hashlib
+import time
+
+from app import db
+
+ALICE = b'{"name": "Alice"}'
+MALLORY = b'{"name": "Mallory"}'
+
+
+def post_player(client, body, key):
+    return client.post('/players', data=body, content_type='application/json', headers={'Idempotency-Key': key})
+
+
+def leave_claim(app, models, key, body, age):
+    # A claim with no stored response, as left by a request still running or one that died mid-way
+    with app.app_context():
+        fingerprint = hashlib.sha256(b'POST /players\n' + body).hexdigest()
+        db.session.add(models['IdempotencyKey'](key=key, fingerprint=fingerprint, created_at=time.time() - age))
+        db.session.commit()
+
+
+def test_overlong_key_is_rejected(client):
+    assert post_player(client, ALICE, 'k' * 256).status_code == 400
+    assert post_player(client, ALICE, 'k' * 255).status_code == 201
+
+
+def test_abandoned_claim_is_only_reclaimed_by_the_same_request(app, client, models):
+    leave_claim(app, models, 'abandoned', ALICE, age=600)
+
+    assert post_player(client, MALLORY, 'abandoned').status_code == 422
+    assert post_player(client, ALICE, 'abandoned').status_code == 201
+    assert post_player(client, ALICE, 'abandoned').headers['Idempotent-Replayed'] == 'true'
+
+
+def test_in_progress_claim_rejects_a_different_request(app, client, models):
+    leave_claim(app, models, 'running', ALICE, age=1)
+
+    assert post_player(client, MALLORY, 'running').status_code == 422
+    assert post_player(client, ALICE, 'running').status_code == 409
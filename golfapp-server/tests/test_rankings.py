@@ -0,0 +1,82 @@
+from app import db
+from conftest import HOLES
+
+
+def seed_results(app, models, client):
+    # One recorded tournament: Alice won, Bob and Carol tied for second
+    for position, points in ((1, 10), (2, 6), (3, 4)):
+        client.post('/merit_points', json={'position': position, 'points': points})
+    player_ids = [client.post('/players', json={'name': name}).get_json()['id'] for name in ('Alice', 'Bob', 'Carol')]
+    tournament_id = client.post('/tournaments', json={'name': 'Open', 'date': '2026-06-01'}).get_json()['id']
+
+    with app.app_context():
+        for player_id, position, points in zip(player_ids, (1, 2, 2), (10, 5, 5)):
+            db.session.add(models['TournamentResult'](tournament_id=tournament_id, player_id=player_id, season='2026',
+                                                      position=position, stableford_total=40 - position, points=points))
+            db.session.add(models['PlayerRanking'](season='2026', player_id=player_id, points=points,
+                                                   events=1, wins=1 if position == 1 else 0))
+        db.session.commit()
+
+
+def ranking_points(client):
+    return {ranking['player_name']: ranking['points'] for ranking in client.get('/rankings').get_json()['rankings']}
+
+
+def test_merit_point_changes_are_applied_to_rankings(app, client, models):
+    seed_results(app, models, client)
+    assert ranking_points(client) == {'Alice': 10, 'Bob': 5, 'Carol': 5}
+
+    client.put('/merit_points/3', json={'points': 2})
+    assert ranking_points(client) == {'Alice': 10, 'Bob': 4, 'Carol': 4}
+
+    client.delete('/merit_points/1')
+    assert ranking_points(client) == {'Alice': 0, 'Bob': 4, 'Carol': 4}
+
+    client.post('/merit_points', json={'position': 1, 'points': 12.5})
+    assert ranking_points(client) == {'Alice': 12.5, 'Bob': 4, 'Carol': 4}
+
+    with app.app_context():
+        assert sorted(result.points for result in models['TournamentResult'].query.all()) == [4, 4, 12.5]
+
+
+def play_round(client, tournament, initiate_round, round_number, gross_by_player):
+    # Scores every hole of a round at one gross score per player, then ends the round
+    for r in initiate_round(tournament, round_number):
+        client.post(f"/rounds/{r['id']}/scores", json={'hole_scores': [
+            {'hole_number': hole_number, 'gross_score': gross_by_player[r['player_id']]} for hole_number in range(1, HOLES + 1)
+        ]})
+    response = client.post(f"/tournaments/{tournament['id']}/rounds/end", json={'round_number': round_number})
+    assert response.status_code == 200
+    return response
+
+
+def rankings(client, season):
+    return {ranking['player_name']: (ranking['points'], ranking['events'], ranking['wins'])
+            for ranking in client.get('/rankings', query_string={'season': season}).get_json()['rankings']}
+
+
+def test_tournament_results_follow_its_rounds_and_date(client, make_tournament, initiate_round):
+    for position, points in ((1, 10), (2, 6), (3, 4)):
+        client.post('/merit_points', json={'position': position, 'points': points})
+    tournament = make_tournament(players=(('Alice', 10.0), ('Bob', 20.0), ('Carol', 20.0)), rounds=2, date='2026-06-01')
+    alice, bob, carol = tournament['player_ids']
+    gross_by_player = {alice: 2, bob: 4, carol: 4}
+
+    play_round(client, tournament, initiate_round, 1, gross_by_player)
+    assert rankings(client, '2026') == {}
+
+    # Ending the last round records the standings; Bob and Carol tie and split second and third
+    play_round(client, tournament, initiate_round, 2, gross_by_player)
+    assert rankings(client, '2026') == {'Alice': (10, 1, 1), 'Bob': (5, 1, 0), 'Carol': (5, 1, 0)}
+
+    last_round = next(r for r in client.get('/rounds').get_json() if r['round_number'] == 2)
+    assert client.post(f"/rounds/{last_round['id']}/reopen").status_code == 200
+    assert rankings(client, '2026') == {}
+
+    assert client.post(f"/tournaments/{tournament['id']}/rounds/end", json={'round_number': 2}).status_code == 200
+    assert rankings(client, '2026') == {'Alice': (10, 1, 1), 'Bob': (5, 1, 0), 'Carol': (5, 1, 0)}
+
+    # Moving the tournament to another season moves its results with it
+    assert client.put(f"/tournaments/{tournament['id']}", json={'date': '2027-03-01'}).status_code == 200
+    assert rankings(client, '2026') == {}
+    assert rankings(client, '2027') == {'Alice': (10, 1, 1), 'Bob': (5, 1, 0), 'Carol': (5, 1, 0)}
@@ -0,0 +1,60 @@
+from flask import g
+
+from app import PRIMARY_STICKY_HEADER, db
+
+
+def player_names(client, headers=None):
+    return [player['name'] for player in client.get('/players', headers=headers).get_json()]
+
+
+def test_reads_without_sticky_header_come_from_replica(app, client, replicate):
+    client.post('/players', json={'name': 'Alice'})
+    replicate()
+    client.post('/players', json={'name': 'Bob'})
+
+    # A client that has not written recently sees the (stale) replica
+    other_client = app.test_client()
+    assert player_names(other_client) == ['Alice']
+
+
+def test_reads_within_sticky_window_come_from_primary(app, client, replicate):
+    client.post('/players', json={'name': 'Alice'})
+    replicate()
+    response = client.post('/players', json={'name': 'Bob'})
+
+    assert 'Set-Cookie' not in response.headers
+    assert player_names(client) == ['Alice', 'Bob']
+
+    # Without the header, with an expired deadline or with garbage, reads use the replica
+    plain_client = app.test_client()
+    assert player_names(plain_client) == ['Alice']
+    assert player_names(plain_client, {PRIMARY_STICKY_HEADER: '1'}) == ['Alice']
+    assert player_names(plain_client, {PRIMARY_STICKY_HEADER: 'soon'}) == ['Alice']
+    assert player_names(plain_client, {PRIMARY_STICKY_HEADER: response.headers[PRIMARY_STICKY_HEADER]}) == ['Alice', 'Bob']
+
+
+def test_sticky_header_is_exposed_to_the_cross_origin_client(client):
+    origin = {'Origin': 'https://react-frontend-t8y9.onrender.com'}
+    response = client.post('/players', json={'name': 'Alice'}, headers=origin)
+    assert PRIMARY_STICKY_HEADER in response.headers['Access-Control-Expose-Headers']
+
+    preflight = client.options('/players', headers={**origin, 'Access-Control-Request-Method': 'GET',
+                                                    'Access-Control-Request-Headers': PRIMARY_STICKY_HEADER})
+    assert PRIMARY_STICKY_HEADER.lower() in preflight.headers['Access-Control-Allow-Headers'].lower()
+
+
+def test_dml_pins_rest_of_request_to_primary(app, client, replicate):
+    client.post('/players', json={'name': 'Alice'})
+    replicate()
+    player_table = db.metadata.tables['player']
+
+    with app.test_request_context('/players', method='GET'):
+        g.use_replica = True
+        assert db.session.get_bind(clause=player_table.select()) is db.engines['replica']
+
+        db.session.execute(player_table.insert().values(name='Bob'))
+        names = db.session.execute(db.select(player_table.c.name).order_by(player_table.c.id)).scalars().all()
+
+        assert names == ['Alice', 'Bob']
+        assert g.use_replica is False
+        db.session.rollback()
@@ -0,0 +1,83 @@
+SUMMARY_FIELDS = {'gross_score': 'gross_score', 'nett_score': 'nett_score', 'stableford': 'stableford_points'}
+
+
+def patch_scores(client, round_id, scores):
+    response = client.patch(f'/rounds/{round_id}/scores', json={
+        'hole_scores': [{'hole_number': hole_number, 'gross_score': gross} for hole_number, gross in scores.items()],
+    })
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def resummed(round_dict):
+    # The summaries as a full re-sum of the hole rows would give them; a half with no holes stays empty
+    halves = {
+        'front_9': [s for s in round_dict['hole_scores'] if s['hole_number'] <= 9],
+        'back_9': [s for s in round_dict['hole_scores'] if s['hole_number'] > 9],
+        'total': round_dict['hole_scores'],
+    }
+    return {
+        f'{summary}_{half}': sum(s[field] for s in scores) if scores else None
+        for half, scores in halves.items() for summary, field in SUMMARY_FIELDS.items()
+    }
+
+
+def summaries(round_dict):
+    return {field: round_dict[field] for field in resummed(round_dict)}
+
+
+def test_partial_and_overlapping_patches_keep_summaries_equal_to_the_hole_rows(client, make_tournament, initiate_round):
+    round_id = initiate_round(make_tournament(players=(('Alice', 10.0),)))[0]['id']
+
+    round_dict = patch_scores(client, round_id, {1: 5, 2: 4, 3: 6})
+    assert round_dict['thru'] == 3
+    assert round_dict['gross_score_front_9'] == 15
+    assert round_dict['gross_score_back_9'] is None
+    assert summaries(round_dict) == resummed(round_dict)
+
+    # Corrections to holes already played, mixed with new holes in both halves
+    round_dict = patch_scores(client, round_id, {2: 7, 3: 3, 9: 4, 10: 5, 18: 2})
+    assert round_dict['thru'] == 6
+    assert (round_dict['gross_score_front_9'], round_dict['gross_score_back_9'], round_dict['gross_score_total']) == (19, 7, 26)
+    assert summaries(round_dict) == resummed(round_dict)
+
+    round_dict = patch_scores(client, round_id, {hole_number: 4 for hole_number in range(1, 19)})
+    assert round_dict['thru'] == 18
+    assert round_dict['gross_score_total'] == 72
+    assert summaries(round_dict) == resummed(round_dict)
+
+    # What is stored matches what the PATCH returned
+    stored = client.get(f'/rounds/{round_id}/scores').get_json()
+    assert sorted((s['hole_number'], s['gross_score'], s['nett_score'], s['stableford_points']) for s in stored) == \
+        sorted((s['hole_number'], s['gross_score'], s['nett_score'], s['stableford_points']) for s in round_dict['hole_scores'])
+
+
+def test_resending_unchanged_holes_does_not_bump_the_version(client, make_tournament, initiate_round):
+    round_id = initiate_round(make_tournament(players=(('Alice', 10.0),)))[0]['id']
+
+    first = patch_scores(client, round_id, {1: 5, 10: 4})
+    assert first['version'] == 2
+
+    resent = patch_scores(client, round_id, {1: 5, 10: 4})
+    assert resent['version'] == 2
+    assert summaries(resent) == summaries(first)
+
+    # Resending a played hole alongside a changed one counts as a single change
+    changed = patch_scores(client, round_id, {1: 5, 10: 6})
+    assert changed['version'] == 3
+    assert changed['gross_score_total'] == 11
+    assert summaries(changed) == resummed(changed)
+
+
+def test_invalid_patch_leaves_the_round_untouched(client, make_tournament, initiate_round):
+    round_id = initiate_round(make_tournament(players=(('Alice', 10.0),)))[0]['id']
+    before = patch_scores(client, round_id, {1: 5})
+
+    response = client.patch(f'/rounds/{round_id}/scores', json={'hole_scores': [
+        {'hole_number': 2, 'gross_score': 4}, {'hole_number': 19, 'gross_score': 4},
+    ]})
+
+    assert response.status_code == 400
+    after = client.get(f'/rounds/{round_id}/scores').get_json()
+    assert [(s['hole_number'], s['gross_score']) for s in after] == [(1, 5)]
+    assert patch_scores(client, round_id, {1: 5})['version'] == before['version']
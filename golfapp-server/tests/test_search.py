@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+from app import SearchIndex
+
+
+def search_names(client, query, **params):
+    return [player['name'] for player in client.get('/players/search', query_string={'q': query, **params}).get_json()]
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    # Counts full reloads of the search indexes
+    calls = []
+    original_load = SearchIndex.load
+
+    def load(index, entries, generation):
+        calls.append(generation)
+        original_load(index, entries, generation)
+    monkeypatch.setattr(SearchIndex, 'load', load)
+    return calls
+
+
+@pytest.fixture
+def as_other_worker(monkeypatch):
+    # Runs writes through the endpoints without this process's index hearing of them
+    def run(write):
+        with monkeypatch.context() as patch:
+            patch.setattr(SearchIndex, 'apply', lambda index, generation, added=(), removed=(): None)
+            write()
+    return run
+
+
+def test_local_writes_update_the_index_without_reloading(client, loads):
+    client.post('/players', json={'name': 'Alice'})
+    assert search_names(client, 'al') == ['Alice']
+    assert len(loads) == 1
+
+    player_id = client.post('/players', json={'name': 'Alan'}).get_json()['id']
+    client.put(f'/players/{player_id}', json={'name': 'Albert'})
+    client.post('/players/bulk', json={'players': [{'name': 'Alfred'}, {'name': 'Alma'}]})
+    client.delete('/players/bulk', json={'player_ids': [1]})
+
+    assert search_names(client, 'al') == ['Albert', 'Alfred', 'Alma']
+    assert len(loads) == 1
+
+
+def test_other_workers_writes_reload_the_index(app, client, loads, as_other_worker):
+    client.post('/players', json={'name': 'Alice'})
+    assert search_names(client, 'al') == ['Alice']
+
+    as_other_worker(lambda: client.put('/players/1', json={'name': 'Beatrice'}))
+    # A fresh client reads from the (empty) replica; the index must still come from the primary
+    assert search_names(app.test_client(), 'bea') == ['Beatrice']
+    assert len(loads) == 2
+
+    as_other_worker(lambda: client.post('/players', json={'name': 'Bea'}))
+    client.post('/players', json={'name': 'Bella'})
+    assert search_names(client, 'be') == ['Bea', 'Beatrice', 'Bella']
+
+
+def test_search_ranks_prefix_tiers_before_fuzzy_matches(client):
+    client.post('/players/bulk', json={'players': [
+        {'name': 'John Smith'}, {'name': 'Smithers'}, {'name': 'Anna Smith'}, {'name': 'Smith'}, {'name': 'Jon Smyth'},
+    ]})
+
+    assert search_names(client, 'smith') == ['Smith', 'Smithers', 'Anna Smith', 'John Smith', 'Jon Smyth']
+    assert search_names(client, 'smith', limit=3) == ['Smith', 'Smithers', 'Anna Smith']
+    assert search_names(client, 'smyth') == ['Jon Smyth', 'Smith', 'Anna Smith', 'John Smith']
+
+
+def test_search_limit_is_at_least_one(client):
+    client.post('/players', json={'name': 'Alice'})
+    assert search_names(client, 'al', limit=0) == ['Alice']
+    assert search_names(client, 'al', limit=-5) == ['Alice']
+
+
+def test_prefix_search_does_not_scan_the_index():
+    index = SearchIndex()
+    index.load(((i, {'id': i}, [f'Player {i} Smith{i}']) for i in range(5000)), 0)
+
+    for query in ('pla', 'smi', 'smith12'):
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            index.search(query, 10)
+            timings.append(time.perf_counter() - start)
+        assert min(timings) < 0.005
+    assert [record['id'] for record in index.search('smith12', 3)] == [12, 120, 1200]
@@ -0,0 +1,92 @@
+from conftest import HOLES
+
+
+def sync(client, updates, **body):
+    response = client.post('/sync', json={'updates': updates, **body})
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def hole(hole_number, gross_score=4):
+    return {'hole_number': hole_number, 'gross_score': gross_score}
+
+
+def get_round(client, round_id):
+    return next(r for r in client.get('/rounds').get_json() if r['id'] == round_id)
+
+
+def test_sync_rejects_an_update_made_against_a_stale_version(client, make_tournament, initiate_round):
+    round_id = initiate_round(make_tournament())[0]['id']
+
+    applied = sync(client, [{'round_id': round_id, 'base_version': 1, 'hole_scores': [hole(1, 5)]}])
+    assert applied['results'] == [{'round_id': round_id, 'status': 'applied', 'version': 2}]
+
+    stale = sync(client, [{'round_id': round_id, 'base_version': 1, 'hole_scores': [hole(1, 3)]}])
+    assert stale['results'] == [{'round_id': round_id, 'status': 'conflict', 'version': 2}]
+    # The conflict carries the current round so the client can redo its edit on top of it
+    assert [(r['id'], r['gross_score_total']) for r in stale['rounds']] == [(round_id, 5)]
+
+
+def test_sync_applies_queued_updates_sharing_one_base_version(client, make_tournament, initiate_round):
+    round_id = initiate_round(make_tournament())[0]['id']
+
+    result = sync(client, [
+        {'round_id': round_id, 'base_version': 1, 'hole_scores': [hole(1, 5), hole(2)]},
+        {'round_id': round_id, 'base_version': 1, 'hole_scores': [hole(2, 6), hole(10, 3)]},
+    ])
+
+    assert [(r['status'], r['version']) for r in result['results']] == [('applied', 2), ('applied', 3)]
+    scores = {score['hole_number']: score['gross_score'] for score in client.get(f'/rounds/{round_id}/scores').get_json()}
+    assert scores == {1: 5, 2: 6, 10: 3}
+
+
+def test_sync_does_not_change_a_finalized_round(client, make_tournament, initiate_round):
+    tournament = make_tournament()
+    rounds = initiate_round(tournament)
+    sync(client, [{'round_id': r['id'], 'hole_scores': [hole(n) for n in range(1, HOLES + 1)]} for r in rounds])
+    assert client.post(f"/tournaments/{tournament['id']}/rounds/end", json={'round_number': 1}).status_code == 200
+
+    result = sync(client, [{'round_id': rounds[0]['id'], 'hole_scores': [hole(1, 9)]}])
+
+    assert result['results'] == [{'round_id': rounds[0]['id'], 'status': 'finalized', 'version': 3}]
+    assert get_round(client, rounds[0]['id'])['gross_score_total'] == 4 * HOLES
+
+
+def test_sync_returns_only_rounds_that_differ_from_known_versions(client, make_tournament, initiate_round):
+    tournament = make_tournament()
+    first, second = (r['id'] for r in initiate_round(tournament))
+    other_round = initiate_round(make_tournament(name='Other', players=(('Carol', 5.0),)))[0]['id']
+    sync(client, [{'round_id': second, 'hole_scores': [hole(1)]}])
+
+    # Scoped to a tournament: every round in it the client doesn't hold at the current version
+    result = sync(client, [], tournament_id=tournament['id'], known_versions={str(first): 1, str(second): 1})
+    assert [(r['id'], r['version']) for r in result['rounds']] == [(second, 2)]
+
+    result = sync(client, [], tournament_id=tournament['id'], known_versions={str(first): 1, str(second): 2})
+    assert result['rounds'] == []
+
+    # Unscoped: only the rounds the client knows about or just updated
+    result = sync(client, [{'round_id': first, 'hole_scores': [hole(1)]}], known_versions={str(second): 1, str(other_round): 1})
+    assert sorted(r['id'] for r in result['rounds']) == [first, second]
+
+
+def test_sync_rejects_malformed_updates_one_by_one(client, make_tournament, initiate_round):
+    round_id = initiate_round(make_tournament())[0]['id']
+
+    result = sync(client, [
+        'x',
+        {'round_id': [1]},
+        {'round_id': str(round_id), 'hole_scores': [hole(1)]},
+        {'round_id': round_id, 'hole_scores': {'hole_number': 1}},
+        {'round_id': round_id, 'hole_scores': ['x']},
+        {'round_id': round_id, 'hole_scores': [{'hole_number': '1', 'gross_score': 4}]},
+        {'round_id': 999, 'hole_scores': [hole(1)]},
+        {'round_id': round_id, 'hole_scores': [hole(1)]},
+    ])
+
+    assert [r['status'] for r in result['results']] == ['rejected'] * 6 + ['not_found', 'applied']
+    assert get_round(client, round_id)['version'] == 2
+
+    assert client.post('/sync', json={'updates': {'round_id': round_id}}).status_code == 400
+    assert client.post('/sync', json=['x']).status_code == 400
+    assert client.post('/sync', json={'updates': [], 'tournament_id': [1]}).status_code == 400